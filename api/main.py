@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from database import init_db
+from sports.http import close_client
 from api.routers import matches, trades, positions, metrics, config, system, backtest, nfl, sports
 
 
@@ -22,6 +23,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Shock Trade API...")
+    await close_client()
 
 
 app = FastAPI(
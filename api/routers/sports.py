@@ -1,6 +1,7 @@
 """
 Unified Sports API router - All sports in one place.
 """
+import asyncio
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -71,6 +72,19 @@ def _get_providers():
     }
 
 
+async def _fetch_all(providers: Dict[str, Any], live: bool = False) -> Dict[str, Any]:
+    """
+    Fetch games from every provider concurrently.
+    
+    Values are game lists, or the exception a provider raised.
+    """
+    results = await asyncio.gather(
+        *(p.get_live_games() if live else p.get_games_today() for p in providers.values()),
+        return_exceptions=True
+    )
+    return dict(zip(providers, results))
+
+
 def _game_to_response(game, has_position: bool = False) -> GameResponse:
     """Convert BaseGame to GameResponse."""
     return GameResponse(
@@ -107,21 +121,20 @@ async def get_all_sports_status():
     providers = _get_providers()
     result = []
     
-    for name, provider in providers.items():
-        try:
-            games = await provider.get_games_today()
-            live = [g for g in games if g.status.value == "in_progress"]
-            result.append(SportStatusResponse(
-                name=name,
-                enabled=True,
-                live_games=len(live),
-                total_games_today=len(games)
-            ))
-        except Exception as e:
-            logger.error(f"Error getting {name} status: {e}")
+    for name, games in (await _fetch_all(providers)).items():
+        if isinstance(games, BaseException):
+            logger.error(f"Error getting {name} status: {games}")
             result.append(SportStatusResponse(
                 name=name, enabled=False, live_games=0, total_games_today=0
             ))
+            continue
+        live = [g for g in games if g.status.value == "in_progress"]
+        result.append(SportStatusResponse(
+            name=name,
+            enabled=True,
+            live_games=len(live),
+            total_games_today=len(games)
+        ))
     
     return result
 
@@ -136,13 +149,12 @@ async def get_all_live_games():
     positions = state_manager.get_open_positions()
     position_ids = {p.match_id for p in positions}
     
-    for name, provider in providers.items():
-        try:
-            games = await provider.get_live_games()
-            for game in games:
-                all_games.append(_game_to_response(game, game.id in position_ids))
-        except Exception as e:
-            logger.error(f"Error fetching {name} games: {e}")
+    for name, games in (await _fetch_all(providers, live=True)).items():
+        if isinstance(games, BaseException):
+            logger.error(f"Error fetching {name} games: {games}")
+            continue
+        for game in games:
+            all_games.append(_game_to_response(game, game.id in position_ids))
     
     return all_games
 
@@ -157,13 +169,12 @@ async def get_all_games_today():
     positions = state_manager.get_open_positions()
     position_ids = {p.match_id for p in positions}
     
-    for name, provider in providers.items():
-        try:
-            games = await provider.get_games_today()
-            for game in games:
-                all_games.append(_game_to_response(game, game.id in position_ids))
-        except Exception as e:
-            logger.error(f"Error fetching {name} games: {e}")
+    for name, games in (await _fetch_all(providers)).items():
+        if isinstance(games, BaseException):
+            logger.error(f"Error fetching {name} games: {games}")
+            continue
+        for game in games:
+            all_games.append(_game_to_response(game, game.id in position_ids))
     
     return all_games
 
@@ -225,12 +236,11 @@ async def refresh_sport(sport: str):
     
     if sport == "all":
         results = {}
-        for name, provider in providers.items():
-            try:
-                games = await provider.get_games_today()
+        for name, games in (await _fetch_all(providers)).items():
+            if isinstance(games, BaseException):
+                results[name] = f"error: {str(games)}"
+            else:
                 results[name] = len(games)
-            except Exception as e:
-                results[name] = f"error: {str(e)}"
         return {"status": "success", "games": results}
     
     if sport not in providers:
@@ -249,6 +259,12 @@ async def refresh_sport(sport: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/dedup")
+async def get_dedup_stats():
+    """Get seen-event cache counters per sport."""
+    return {name: p.get_dedup_stats() for name, p in _get_providers().items()}
+
+
 @router.get("/summary")
 async def get_sports_summary():
     """Get summary of all sports activity."""
@@ -260,22 +276,21 @@ async def get_sports_summary():
         "total_today": 0
     }
     
-    for name, provider in providers.items():
-        try:
-            games = await provider.get_games_today()
-            live = [g for g in games if g.status.value == "in_progress"]
-            summary["sports"][name] = {
-                "live": len(live),
-                "today": len(games),
-                "status": "active"
-            }
-            summary["total_live"] += len(live)
-            summary["total_today"] += len(games)
-        except Exception as e:
+    for name, games in (await _fetch_all(providers)).items():
+        if isinstance(games, BaseException):
             summary["sports"][name] = {
                 "live": 0,
                 "today": 0,
-                "status": f"error: {str(e)}"
+                "status": f"error: {str(games)}"
             }
+            continue
+        live = [g for g in games if g.status.value == "in_progress"]
+        summary["sports"][name] = {
+            "live": len(live),
+            "today": len(games),
+            "status": "active"
+        }
+        summary["total_live"] += len(live)
+        summary["total_today"] += len(games)
     
     return summary
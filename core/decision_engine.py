@@ -29,11 +29,11 @@ class DecisionEngine:
     - Apply additional filters: liquidity, time remaining, score differential
     """
     
-    def __init__(self):
-        self.underdog_threshold = settings.underdog_threshold
-        self.min_liquidity = settings.min_liquidity
-        self.max_price_after_goal = 0.65  # Don't buy if price already spiked too high
-        self.min_time_remaining = 15  # Minutes - don't trade in final 15 mins
+    def __init__(self) -> None:
+        self.underdog_threshold: float = settings.underdog_threshold
+        self.min_liquidity: float = settings.min_liquidity
+        self.max_price_after_goal: float = 0.65  # Don't buy if price already spiked too high
+        self.min_time_remaining: int = 15  # Minutes - don't trade in final 15 mins
     
     def is_underdog(
         self,
@@ -4,14 +4,47 @@ Market Mapper - Maps football matches to exchange markets.
 Handles team name normalization and fuzzy matching to find
 corresponding prediction markets for live football matches.
 """
+import re
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable, Optional, List, Dict, Tuple
 from loguru import logger
 
 from core.models import Match, Market, MatchMarketMapping
 from exchanges.kalshi_client import kalshi_client
 
+# Trailing club suffixes stripped (one or more) when normalizing team names
+_TEAM_SUFFIX_RE = re.compile(r"(?:\s+(?:fc|cf|sc|afc|united|city))+$")
+
+
+def alias_match_score(aliases: Iterable[str], text_lower: str) -> float:
+    """
+    Best confidence (0-1) that any alias names a team in lowercased text.
+    
+    A direct substring hit scores 0.9; otherwise the best fuzzy ratio.
+    """
+    aliases = tuple(aliases)
+    
+    # Direct substring matches first, so the fuzzy pass below starts from
+    # 0.9 and can prune almost every alias on its cheap upper bounds
+    best_score = 0.9 if any(alias in text_lower for alias in aliases) else 0.0
+    
+    # SequenceMatcher indexes its second sequence, so build it once per
+    # text and only swap in each alias
+    matcher = SequenceMatcher(None, "", text_lower)
+    for alias in aliases:
+        if alias in text_lower:
+            continue
+        
+        # Fuzzy match, skipped when its upper bounds can't beat the best
+        matcher.set_seq1(alias)
+        if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+            continue
+        best_score = max(best_score, matcher.ratio())
+    
+    return best_score
+
 
 class MarketMapper:
     """
@@ -45,39 +78,38 @@ class MarketMapper:
         "juventus": ["juve"],
     }
     
-    def __init__(self):
+    def __init__(self) -> None:
         self._market_cache: Dict[str, List[Market]] = {}
+        # (market, lowercased title + subtitle) built once per cache refresh
+        self._search_index: List[Tuple[Market, str]] = []
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl = timedelta(minutes=5)
     
-    def _normalize_team_name(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_team_name(name: str) -> str:
         """
         Normalize team name for matching.
         
         Removes common suffixes, converts to lowercase, strips whitespace.
+        Memoized: the same few team names are normalized for every market.
         """
-        normalized = name.lower().strip()
-        
-        # Remove common suffixes
-        suffixes = [" fc", " cf", " sc", " afc", " united", " city"]
-        for suffix in suffixes:
-            if normalized.endswith(suffix):
-                normalized = normalized[:-len(suffix)]
-        
-        return normalized.strip()
+        return _TEAM_SUFFIX_RE.sub("", name.lower().strip())
     
-    def _get_team_aliases(self, team_name: str) -> List[str]:
-        """Get all known aliases for a team name."""
-        normalized = self._normalize_team_name(team_name)
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _get_team_aliases(cls, team_name: str) -> Tuple[str, ...]:
+        """Get all known aliases for a team name (memoized, so immutable)."""
+        normalized = cls._normalize_team_name(team_name)
         aliases = [normalized, team_name.lower()]
         
         # Check if this team has known aliases
-        for canonical, alias_list in self.TEAM_ALIASES.items():
+        for canonical, alias_list in cls.TEAM_ALIASES.items():
             if normalized == canonical or normalized in alias_list:
                 aliases.extend([canonical] + alias_list)
                 break
         
-        return list(set(aliases))
+        return tuple(dict.fromkeys(aliases))
     
     def _similarity_score(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings (0-1)."""
@@ -90,20 +122,12 @@ class MarketMapper:
         Returns:
             Confidence score 0-1, where 1 is exact match.
         """
-        text_lower = text.lower()
-        aliases = self._get_team_aliases(team_name)
-        
-        best_score = 0.0
-        for alias in aliases:
-            if alias in text_lower:
-                # Direct substring match
-                best_score = max(best_score, 0.9)
-            else:
-                # Fuzzy match
-                score = self._similarity_score(alias, text_lower)
-                best_score = max(best_score, score)
-        
-        return best_score
+        return alias_match_score(self._get_team_aliases(team_name), text.lower())
+    
+    @staticmethod
+    def _index_markets(markets: List[Market]) -> List[Tuple[Market, str]]:
+        """Pair each market with its lowercased search text."""
+        return [(m, f"{m.title} {m.subtitle or ''}".lower()) for m in markets]
     
     async def refresh_market_cache(self) -> None:
         """Refresh the market cache from exchanges."""
@@ -114,6 +138,7 @@ class MarketMapper:
             
             # Index markets by keywords for faster lookup
             self._market_cache = {"all": markets}
+            self._search_index = self._index_markets(markets)
             self._cache_timestamp = datetime.utcnow()
             
             logger.info(f"Cached {len(markets)} markets from Kalshi")
@@ -146,16 +171,14 @@ class MarketMapper:
         if not self._is_cache_valid():
             await self.refresh_market_cache()
         
-        all_markets = self._market_cache.get("all", [])
         matching_markets = []
         
         home_name = match.home_team.name
         away_name = match.away_team.name
+        league_lower = match.league_name.lower()
         
-        for market in all_markets:
+        for market, search_text in self._search_index:
             # Check if both teams appear in market title/subtitle
-            search_text = f"{market.title} {market.subtitle or ''}"
-            
             home_score = self._match_team_in_text(home_name, search_text)
             away_score = self._match_team_in_text(away_name, search_text)
             
@@ -169,7 +192,7 @@ class MarketMapper:
             # Or check for league + one team (for winner markets)
             elif home_score >= min_confidence or away_score >= min_confidence:
                 # Check if league name is mentioned
-                if match.league_name.lower() in search_text.lower():
+                if league_lower in search_text:
                     matching_markets.append(market)
         
         return matching_markets
@@ -96,6 +96,8 @@ class GoalEvent(BaseModel):
 
 class Market(BaseModel):
     """Exchange market information."""
+    model_config = {"frozen": True}  # Snapshots: update via model_copy
+    
     id: str = Field(description="Exchange market ID")
     exchange: str = Field(description="Exchange name (kalshi, polymarket)")
     title: str
@@ -135,6 +137,8 @@ class MatchMarketMapping(BaseModel):
 
 class OrderIntent(BaseModel):
     """Intent to place an order - generated by decision engine."""
+    model_config = {"frozen": True}  # Snapshots: update via model_copy
+    
     id: str = Field(description="Unique intent ID")
     match_id: int
     market_id: str
@@ -251,8 +255,21 @@ class NFLGameStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+# Statuses in which an NFL game clock is running (or paused mid-quarter)
+NFL_LIVE_STATUSES = frozenset({
+    NFLGameStatus.FIRST_QUARTER,
+    NFLGameStatus.SECOND_QUARTER,
+    NFLGameStatus.THIRD_QUARTER,
+    NFLGameStatus.FOURTH_QUARTER,
+    NFLGameStatus.OVERTIME,
+    NFLGameStatus.IN_PROGRESS
+})
+
+
 class NFLTeam(BaseModel):
     """NFL team information."""
+    model_config = {"frozen": True}  # Snapshots: update via model_copy
+    
     id: int
     name: str
     abbreviation: str = ""
@@ -265,6 +282,8 @@ class NFLTeam(BaseModel):
 
 class NFLGame(BaseModel):
     """NFL game information."""
+    model_config = {"frozen": True}  # Snapshots: update via model_copy
+    
     id: int
     home_team: NFLTeam
     away_team: NFLTeam
@@ -285,14 +304,7 @@ class NFLGame(BaseModel):
     
     @property
     def is_live(self) -> bool:
-        return self.status in (
-            NFLGameStatus.FIRST_QUARTER,
-            NFLGameStatus.SECOND_QUARTER,
-            NFLGameStatus.THIRD_QUARTER,
-            NFLGameStatus.FOURTH_QUARTER,
-            NFLGameStatus.OVERTIME,
-            NFLGameStatus.IN_PROGRESS
-        )
+        return self.status in NFL_LIVE_STATUSES
 
 
 class NFLScoringEvent(BaseModel):
@@ -315,6 +327,8 @@ class NFLScoringEvent(BaseModel):
 
 class NFLGameMarketMapping(BaseModel):
     """Maps an NFL game to exchange markets."""
+    model_config = {"frozen": True}  # Snapshots: update via model_copy
+    
     game_id: int
     home_team_name: str
     away_team_name: str
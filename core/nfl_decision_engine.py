@@ -18,6 +18,48 @@ from core.models import (
 )
 
 
+def _spread_verdict(is_home: bool, spread: float) -> Tuple[bool, float, str]:
+    """Underdog verdict for one side of a home-perspective spread."""
+    # Negative spread = home favored, Positive = away favored
+    if is_home:
+        # Home team is underdog if spread is positive (they're getting points)
+        is_underdog = spread > 0
+        team_spread = spread
+    else:
+        # Away team is underdog if spread is negative (home is favored)
+        is_underdog = spread < 0
+        team_spread = -spread
+    
+    reason = f"Spread: {'+' if team_spread > 0 else ''}{team_spread}"
+    return (is_underdog, team_spread, reason)
+
+
+def _timing_verdict(quarter: int) -> Tuple[bool, str]:
+    """Time-remaining verdict for a quarter."""
+    # Don't trade in 4th quarter or OT - too volatile
+    if quarter >= 4:
+        return (False, f"Too late in game (Q{quarter})")
+    
+    # Prefer first half for more time to realize value
+    if quarter <= 2:
+        return (True, f"Good timing (Q{quarter})")
+    
+    return (True, f"Acceptable timing (Q{quarter})")
+
+
+def _differential_verdict(diff: int) -> Tuple[bool, str]:
+    """Score-differential verdict for a point gap."""
+    # If game is a blowout, skip
+    if diff > 21:
+        return (False, f"Blowout game ({diff} point differential)")
+    
+    # Close games are ideal
+    if diff <= 14:
+        return (True, f"Competitive game ({diff} point differential)")
+    
+    return (True, f"Moderate differential ({diff} points)")
+
+
 class NFLDecisionEngine:
     """
     Implements the underdog scoring-reaction trading strategy for NFL.
@@ -73,18 +115,7 @@ class NFLDecisionEngine:
             return (not is_home, None, "No spread - assuming away is underdog")
         
         # Spread is typically from home team perspective
-        # Negative spread = home favored, Positive = away favored
-        if is_home:
-            # Home team is underdog if spread is positive (they're getting points)
-            is_underdog = spread > 0
-            team_spread = spread
-        else:
-            # Away team is underdog if spread is negative (home is favored)
-            is_underdog = spread < 0
-            team_spread = -spread
-        
-        reason = f"Spread: {'+' if team_spread > 0 else ''}{team_spread}"
-        return (is_underdog, team_spread, reason)
+        return _spread_verdict(is_home, spread)
     
     def find_best_market(
         self,
@@ -107,6 +138,7 @@ class NFLDecisionEngine:
         team = game.home_team if is_home else game.away_team
         team_name = team.name.lower()
         team_abbrev = team.abbreviation.lower()
+        name_words = [word for word in team_name.split() if len(word) > 3]
         
         best_market = None
         best_score = 0
@@ -118,7 +150,7 @@ class NFLDecisionEngine:
             name_match = (
                 team_name in title_lower or
                 team_abbrev in title_lower or
-                any(word in title_lower for word in team_name.split() if len(word) > 3)
+                any(word in title_lower for word in name_words)
             )
             
             if name_match:
@@ -219,17 +251,7 @@ class NFLDecisionEngine:
         Returns:
             Tuple of (time_ok, reason).
         """
-        quarter = scoring_event.quarter or game.quarter
-        
-        # Don't trade in 4th quarter or OT - too volatile
-        if quarter >= 4:
-            return (False, f"Too late in game (Q{quarter})")
-        
-        # Prefer first half for more time to realize value
-        if quarter <= 2:
-            return (True, f"Good timing (Q{quarter})")
-        
-        return (True, f"Acceptable timing (Q{quarter})")
+        return _timing_verdict(scoring_event.quarter or game.quarter)
     
     def check_score_differential(
         self,
@@ -246,17 +268,7 @@ class NFLDecisionEngine:
         Returns:
             Tuple of (diff_ok, reason).
         """
-        diff = abs(scoring_event.home_score - scoring_event.away_score)
-        
-        # If game is a blowout, skip
-        if diff > 21:
-            return (False, f"Blowout game ({diff} point differential)")
-        
-        # Close games are ideal
-        if diff <= 14:
-            return (True, f"Competitive game ({diff} point differential)")
-        
-        return (True, f"Moderate differential ({diff} points)")
+        return _differential_verdict(abs(scoring_event.home_score - scoring_event.away_score))
     
     def evaluate_scoring_event(
         self,
@@ -278,14 +290,14 @@ class NFLDecisionEngine:
             OrderIntent if trade should be placed, None otherwise.
         """
         logger.info(
-            f"Evaluating score: {scoring_event.scoring_team_name} "
-            f"{scoring_event.scoring_type} (+{scoring_event.points_scored}) "
-            f"in {game.display_name}"
+            "Evaluating score: {} {} (+{}) in {}",
+            scoring_event.scoring_team_name, scoring_event.scoring_type,
+            scoring_event.points_scored, game.display_name
         )
         
         # Step 0: Only react to significant scores (touchdowns)
         if scoring_event.points_scored < self.min_points_for_signal:
-            logger.info(f"Score too small ({scoring_event.points_scored} pts). Skipping.")
+            logger.info("Score too small ({} pts). Skipping.", scoring_event.points_scored)
             return None
         
         # Step 1: Check if scoring team was underdog
@@ -294,19 +306,19 @@ class NFLDecisionEngine:
         )
         
         if not is_underdog:
-            logger.info(f"Scoring team was not underdog ({underdog_reason}). Skipping.")
+            logger.info("Scoring team was not underdog ({}). Skipping.", underdog_reason)
             return None
         
-        logger.info(f"Underdog touchdown detected! {underdog_reason}")
+        logger.info("Underdog touchdown detected! {}", underdog_reason)
         
         # Step 2: Find best market to trade
         market = self.find_best_market(scoring_event.scoring_team_id, game, mapping)
         
         if market is None:
-            logger.warning(f"No suitable market found for {scoring_event.scoring_team_name}")
+            logger.warning("No suitable market found for {}", scoring_event.scoring_team_name)
             return None
         
-        logger.info(f"Found market: {market.title} (current price: {market.yes_price})")
+        logger.info("Found market: {} (current price: {})", market.title, market.yes_price)
         
         # Get pre-score probability
         is_home = scoring_event.scoring_team_id == game.home_team.id
@@ -315,25 +327,25 @@ class NFLDecisionEngine:
         # Step 3: Check value
         has_value, value_reason = self.check_value(market, pre_prob, is_underdog)
         if not has_value:
-            logger.info(f"No value: {value_reason}")
+            logger.info("No value: {}", value_reason)
             return None
         
         # Step 4: Check liquidity
         has_liquidity, liquidity_reason = self.check_liquidity(market)
         if not has_liquidity:
-            logger.info(f"Liquidity check failed: {liquidity_reason}")
+            logger.info("Liquidity check failed: {}", liquidity_reason)
             return None
         
         # Step 5: Check time remaining
         time_ok, time_reason = self.check_time_remaining(game, scoring_event)
         if not time_ok:
-            logger.info(f"Time check failed: {time_reason}")
+            logger.info("Time check failed: {}", time_reason)
             return None
         
         # Step 6: Check score differential
         diff_ok, diff_reason = self.check_score_differential(game, scoring_event)
         if not diff_ok:
-            logger.info(f"Score differential check failed: {diff_reason}")
+            logger.info("Score differential check failed: {}", diff_reason)
             return None
         
         # All checks passed - generate order intent
@@ -355,7 +367,7 @@ class NFLDecisionEngine:
             goal_event_id=scoring_event.id
         )
         
-        logger.info(f"Generated order intent: {order_intent.id}")
+        logger.info("Generated order intent: {}", order_intent.id)
         return order_intent
 
 
@@ -5,10 +5,12 @@ Handles team name normalization and fuzzy matching to find
 corresponding prediction markets for live NFL games.
 """
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from difflib import SequenceMatcher
+from functools import lru_cache
 from loguru import logger
 
+from core.mapper import alias_match_score
 from core.models import NFLGame, Market, NFLGameMarketMapping
 from exchanges.kalshi_client import kalshi_client
 
@@ -56,22 +58,36 @@ class NFLMarketMapper:
         "washington commanders": ["commanders", "was", "washington", "commies"],
     }
     
+    # Keywords that mark a market as NFL-related, built once from the roster
+    NFL_KEYWORDS: Tuple[str, ...] = (
+        "nfl", "football", "touchdown", "super bowl",
+        *(alias for aliases in TEAM_ALIASES.values() for alias in aliases)
+    )
+    
     def __init__(self):
         self._market_cache: Dict[str, List[Market]] = {}
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl = timedelta(minutes=5)
     
-    def _normalize_team_name(self, name: str) -> str:
+    @staticmethod
+    def _normalize_team_name(name: str) -> str:
         """Normalize team name for matching."""
         return name.lower().strip()
     
-    def _get_team_aliases(self, team_name: str) -> List[str]:
-        """Get all known aliases for a team name."""
-        normalized = self._normalize_team_name(team_name)
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _get_team_aliases(cls, team_name: str) -> Tuple[str, ...]:
+        """
+        Get all known aliases for a team name.
+        
+        Memoized (so the result is immutable): the same two team names are
+        looked up for every market on every refresh.
+        """
+        normalized = cls._normalize_team_name(team_name)
         aliases = [normalized]
         
         # Check if this team has known aliases
-        for canonical, alias_list in self.TEAM_ALIASES.items():
+        for canonical, alias_list in cls.TEAM_ALIASES.items():
             # Match if normalized equals canonical or if canonical is contained in normalized
             if normalized == canonical or canonical in normalized or normalized in canonical:
                 aliases.extend([canonical] + alias_list)
@@ -82,7 +98,7 @@ class NFLMarketMapper:
                     aliases.extend([canonical] + alias_list)
                     break
         
-        return list(set(aliases))
+        return tuple(dict.fromkeys(aliases))
     
     def _similarity_score(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings (0-1)."""
@@ -95,20 +111,7 @@ class NFLMarketMapper:
         Returns:
             Confidence score 0-1, where 1 is exact match.
         """
-        text_lower = text.lower()
-        aliases = self._get_team_aliases(team_name)
-        
-        best_score = 0.0
-        for alias in aliases:
-            if alias in text_lower:
-                # Direct substring match
-                best_score = max(best_score, 0.9)
-            else:
-                # Fuzzy match
-                score = self._similarity_score(alias, text_lower)
-                best_score = max(best_score, score)
-        
-        return best_score
+        return alias_match_score(self._get_team_aliases(team_name), text.lower())
     
     async def refresh_market_cache(self) -> None:
         """Refresh the market cache from Kalshi."""
@@ -119,13 +122,10 @@ class NFLMarketMapper:
             all_markets = await kalshi_client.get_markets(limit=200)
             
             # Filter for NFL/football markets
-            nfl_keywords = ["nfl", "football", "touchdown", "super bowl"]
-            nfl_keywords.extend([alias for aliases in self.TEAM_ALIASES.values() for alias in aliases])
-            
             nfl_markets = []
             for market in all_markets:
                 search_text = f"{market.title} {market.subtitle or ''}".lower()
-                if any(kw in search_text for kw in nfl_keywords):
+                if any(kw in search_text for kw in self.NFL_KEYWORDS):
                     nfl_markets.append(market)
             
             self._market_cache = {"all": all_markets, "nfl": nfl_markets}
@@ -12,9 +12,17 @@ from typing import Optional, List, Tuple
 from loguru import logger
 
 from config import settings
-from core.models import Position, Trade, PositionStatus
+from core.models import MatchStatus, Position, Trade, PositionStatus
 from core.state import state_manager
 
+# Match statuses that close out any position on the match
+_ENDED_STATUSES = frozenset({
+    MatchStatus.FINISHED,
+    MatchStatus.CANCELLED,
+    MatchStatus.ABANDONED,
+    MatchStatus.POSTPONED
+})
+
 
 class PostTradeManager:
     """
@@ -23,10 +31,10 @@ class PostTradeManager:
     Monitors positions for exit conditions and computes P/L.
     """
     
-    def __init__(self):
-        self.take_profit_pct = settings.take_profit_pct
-        self.stop_loss_pct = settings.stop_loss_pct
-        self.max_position_time_mins = 90  # Close after 90 minutes
+    def __init__(self) -> None:
+        self.take_profit_pct: float = settings.take_profit_pct
+        self.stop_loss_pct: float = settings.stop_loss_pct
+        self.max_position_time_mins: int = 90  # Close after 90 minutes
     
     def calculate_pnl(
         self,
@@ -49,10 +57,10 @@ class PostTradeManager:
         """
         if outcome.lower() == "yes":
             # Long YES: profit when price goes up
-            pnl_pct = (exit_price - entry_price) / entry_price if entry_price > 0 else 0
+            pnl_pct = (exit_price - entry_price) / entry_price if entry_price > 0 else 0.0
         else:
             # Long NO: profit when price goes down
-            pnl_pct = (entry_price - exit_price) / entry_price if entry_price > 0 else 0
+            pnl_pct = (entry_price - exit_price) / entry_price if entry_price > 0 else 0.0
         
         pnl_dollars = size * pnl_pct
         
@@ -75,17 +83,19 @@ class PostTradeManager:
             position.outcome
         )
     
-    def check_take_profit(self, position: Position) -> bool:
+    def check_take_profit(self, position: Position, pnl_pct: Optional[float] = None) -> bool:
         """
         Check if position should be closed for take-profit.
         
         Args:
             position: The position to check.
+            pnl_pct: Unrealized P/L percent, if already computed.
             
         Returns:
             True if take-profit triggered.
         """
-        _, pnl_pct = self.calculate_unrealized_pnl(position)
+        if pnl_pct is None:
+            _, pnl_pct = self.calculate_unrealized_pnl(position)
         
         if pnl_pct >= self.take_profit_pct * 100:
             logger.info(
@@ -96,17 +106,19 @@ class PostTradeManager:
         
         return False
     
-    def check_stop_loss(self, position: Position) -> bool:
+    def check_stop_loss(self, position: Position, pnl_pct: Optional[float] = None) -> bool:
         """
         Check if position should be closed for stop-loss.
         
         Args:
             position: The position to check.
+            pnl_pct: Unrealized P/L percent, if already computed.
             
         Returns:
             True if stop-loss triggered.
         """
-        _, pnl_pct = self.calculate_unrealized_pnl(position)
+        if pnl_pct is None:
+            _, pnl_pct = self.calculate_unrealized_pnl(position)
         
         if pnl_pct <= -self.stop_loss_pct * 100:
             logger.info(
@@ -117,17 +129,18 @@ class PostTradeManager:
         
         return False
     
-    def check_time_exit(self, position: Position) -> bool:
+    def check_time_exit(self, position: Position, now: Optional[datetime] = None) -> bool:
         """
         Check if position should be closed due to time.
         
         Args:
             position: The position to check.
+            now: Current time, defaults to utcnow().
             
         Returns:
             True if time exit triggered.
         """
-        time_open = (datetime.utcnow() - position.opened_at).total_seconds() / 60
+        time_open = ((now or datetime.utcnow()) - position.opened_at).total_seconds() / 60
         
         if time_open >= self.max_position_time_mins:
             logger.info(
@@ -148,42 +161,37 @@ class PostTradeManager:
         Returns:
             True if match ended.
         """
-        from core.models import MatchStatus
-        
         match = state_manager.get_match(position.match_id)
         if not match:
             return False
         
-        ended_statuses = {
-            MatchStatus.FINISHED,
-            MatchStatus.CANCELLED,
-            MatchStatus.ABANDONED,
-            MatchStatus.POSTPONED
-        }
-        
-        if match.status in ended_statuses:
+        if match.status in _ENDED_STATUSES:
             logger.info(f"Match ended for position {position.id}: {match.status}")
             return True
         
         return False
     
-    def get_exit_reason(self, position: Position) -> Optional[str]:
+    def get_exit_reason(self, position: Position, now: Optional[datetime] = None) -> Optional[str]:
         """
         Determine if and why a position should be exited.
         
         Args:
             position: The position to check.
+            now: Current time, defaults to utcnow().
             
         Returns:
             Exit reason string, or None if no exit needed.
         """
-        if self.check_take_profit(position):
+        # One P/L computation serves both price-based checks
+        _, pnl_pct = self.calculate_unrealized_pnl(position)
+        
+        if self.check_take_profit(position, pnl_pct):
             return "take_profit"
         
-        if self.check_stop_loss(position):
+        if self.check_stop_loss(position, pnl_pct):
             return "stop_loss"
         
-        if self.check_time_exit(position):
+        if self.check_time_exit(position, now):
             return "time_exit"
         
         if self.check_match_ended(position):
@@ -200,9 +208,10 @@ class PostTradeManager:
         """
         positions = state_manager.get_open_positions()
         to_exit = []
+        now = datetime.utcnow()
         
         for position in positions:
-            reason = self.get_exit_reason(position)
+            reason = self.get_exit_reason(position, now)
             if reason:
                 to_exit.append((position, reason))
         
@@ -8,13 +8,39 @@ Implements:
 - Circuit breaker for consecutive errors
 """
 from datetime import datetime, date
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 from loguru import logger
 
 from config import settings
 from core.models import OrderIntent, RiskStatus, Position
 
 
+def _position_size(base_size: float, daily_remaining: float, match_remaining: float) -> float:
+    """
+    Clamp a base trade size to the remaining daily and per-match budgets.
+    
+    Pure arithmetic on plain floats so the hot sizing path does no
+    attribute lookups.
+    
+    Args:
+        base_size: Size from the bankroll percentage.
+        daily_remaining: Daily loss budget still available.
+        match_remaining: Exposure still available on the match.
+    
+    Returns:
+        Position size in dollars, rounded to cents.
+    """
+    # Adjust for remaining daily loss budget
+    if daily_remaining < base_size:
+        base_size = max(0, daily_remaining)
+    
+    # Adjust for per-match exposure
+    if match_remaining < base_size:
+        base_size = max(0, match_remaining)
+    
+    return round(base_size, 2)
+
+
 class RiskManager:
     """
     Manages trading risk and position sizing.
@@ -85,28 +111,14 @@ class RiskManager:
         """
         self._reset_daily_if_needed()
         
-        # Base size from bankroll percentage
         base_size = self.bankroll * self.max_per_trade_pct
-        
-        # Adjust for remaining daily loss budget
         daily_remaining = self.daily_loss_limit + self._daily_pnl
-        if daily_remaining < base_size:
-            base_size = max(0, daily_remaining)
-        
-        # Adjust for per-match exposure
-        current_match_exposure = self._match_exposure.get(intent.match_id, 0)
-        match_remaining = self.per_match_max_exposure - current_match_exposure
-        if match_remaining < base_size:
-            base_size = max(0, match_remaining)
-        
-        # Round to reasonable amount
-        size = round(base_size, 2)
+        match_remaining = self.per_match_max_exposure - self._match_exposure.get(intent.match_id, 0)
+        size = _position_size(base_size, daily_remaining, match_remaining)
         
         logger.debug(
-            f"Position size calculated: ${size} "
-            f"(base: ${self.bankroll * self.max_per_trade_pct:.2f}, "
-            f"daily remaining: ${daily_remaining:.2f}, "
-            f"match remaining: ${match_remaining:.2f})"
+            "Position size calculated: ${} (base: ${:.2f}, daily remaining: ${:.2f}, match remaining: ${:.2f})",
+            size, base_size, daily_remaining, match_remaining
         )
         
         return size
@@ -162,7 +174,7 @@ class RiskManager:
         allowed, reason = self.check_trade_allowed(intent)
         
         if not allowed:
-            logger.warning(f"Trade rejected: {reason}")
+            logger.warning("Trade rejected: {}", reason)
             return (None, reason)
         
         # Calculate and set size
@@ -171,7 +183,7 @@ class RiskManager:
         # Create new intent with size
         approved_intent = intent.model_copy(update={"size": size})
         
-        logger.info(f"Trade approved: ${size:.2f} on {intent.market_id}")
+        logger.info("Trade approved: ${:.2f} on {}", size, intent.market_id)
         return (approved_intent, f"Approved with size ${size:.2f}")
     
     def record_trade_result(
@@ -192,13 +204,12 @@ class RiskManager:
         
         self._daily_pnl += pnl
         
-        current_exposure = self._match_exposure.get(match_id, 0)
-        self._match_exposure[match_id] = max(0, current_exposure + exposure_change)
+        exposure = max(0, self._match_exposure.get(match_id, 0) + exposure_change)
+        self._match_exposure[match_id] = exposure
         
         logger.info(
-            f"Trade recorded: P/L ${pnl:.2f}, "
-            f"Daily P/L: ${self._daily_pnl:.2f}, "
-            f"Match {match_id} exposure: ${self._match_exposure[match_id]:.2f}"
+            "Trade recorded: P/L ${:.2f}, Daily P/L: ${:.2f}, Match {} exposure: ${:.2f}",
+            pnl, self._daily_pnl, match_id, exposure
         )
     
     def record_error(self, error_message: str) -> None:
@@ -218,6 +229,30 @@ class RiskManager:
                 f"Last error: {error_message}"
             )
     
+    def record_errors(self, error_messages: Iterable[str]) -> None:
+        """
+        Record a burst of errors with a single circuit breaker check.
+        
+        Args:
+            error_messages: Descriptions of the errors, oldest first.
+        """
+        count = 0
+        error_message = None
+        for error_message in error_messages:
+            count += 1
+        if not count:
+            return
+        
+        self._consecutive_errors += count
+        self._last_error = error_message
+        
+        if self._consecutive_errors >= self.max_consecutive_errors:
+            self._circuit_breaker_active = True
+            logger.error(
+                f"Circuit breaker ACTIVATED after {self._consecutive_errors} errors. "
+                f"Last error: {error_message}"
+            )
+    
     def record_success(self) -> None:
         """Record a successful operation, resetting error counter."""
         self._consecutive_errors = 0
@@ -7,16 +7,51 @@ Maintains:
 - Open positions
 - Trading metrics
 """
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, List
+from itertools import islice
+from typing import Deque, Optional, Dict, List, Tuple, TypeVar
 from loguru import logger
 
 from core.models import (
     Match, GoalEvent, Position, Trade, MatchMarketMapping,
-    TradingMetrics, PositionStatus,
-    NFLGame, NFLScoringEvent, NFLGameMarketMapping, NFLGameStatus
+    TradingMetrics, PositionStatus, MatchStatus,
+    NFLGame, NFLScoringEvent, NFLGameMarketMapping, NFLGameStatus, NFL_LIVE_STATUSES
 )
 
+T = TypeVar("T")
+
+# Goal / score events kept for the recent-events endpoints (oldest drop off)
+HISTORY_SIZE = 10_000
+
+_LIVE_MATCH_STATUSES = frozenset({
+    MatchStatus.FIRST_HALF,
+    MatchStatus.SECOND_HALF,
+    MatchStatus.HALFTIME,
+    MatchStatus.LIVE
+})
+
+# Statuses after which a match / game is dropped from tracking
+_FINISHED_MATCH_STATUSES = frozenset({
+    MatchStatus.FINISHED,
+    MatchStatus.CANCELLED,
+    MatchStatus.POSTPONED,
+    MatchStatus.ABANDONED
+})
+_FINISHED_NFL_STATUSES = frozenset({
+    NFLGameStatus.FINAL,
+    NFLGameStatus.CANCELLED,
+    NFLGameStatus.POSTPONED
+})
+
+
+def _recent(history: Deque[T], limit: int) -> List[T]:
+    """Return the last ``limit`` items of a history, oldest first (like ``[-limit:]``)."""
+    if 0 < limit < len(history):
+        # Walk in from the newest end so the cost is O(limit), not O(len)
+        return list(islice(reversed(history), limit))[::-1]
+    return list(history)[-limit:]
+
 
 class StateManager:
     """
@@ -36,11 +71,11 @@ class StateManager:
         
         # Goal tracking (soccer - legacy)
         self._processed_goals: set[str] = set()
-        self._goal_history: List[GoalEvent] = []
+        self._goal_history: Deque[GoalEvent] = deque(maxlen=HISTORY_SIZE)
         
         # NFL Score tracking
         self._processed_nfl_scores: set[str] = set()
-        self._nfl_score_history: List[NFLScoringEvent] = []
+        self._nfl_score_history: Deque[NFLScoringEvent] = deque(maxlen=HISTORY_SIZE)
         
         # Position tracking
         self._open_positions: Dict[str, Position] = {}
@@ -48,6 +83,7 @@ class StateManager:
         
         # Trade history
         self._trades: List[Trade] = []
+        self._open_trades: Dict[int, List[Trade]] = {}  # match_id -> trades awaiting exit
         
         # Metrics
         self._metrics = TradingMetrics()
@@ -71,14 +107,7 @@ class StateManager:
     
     def get_live_matches(self) -> List[Match]:
         """Get only live matches."""
-        from core.models import MatchStatus
-        live_statuses = {
-            MatchStatus.FIRST_HALF,
-            MatchStatus.SECOND_HALF,
-            MatchStatus.HALFTIME,
-            MatchStatus.LIVE
-        }
-        return [m for m in self._matches.values() if m.status in live_statuses]
+        return [m for m in self._matches.values() if m.status in _LIVE_MATCH_STATUSES]
     
     def get_previous_matches(self) -> Dict[int, Match]:
         """Get matches dict for goal detection comparison."""
@@ -107,7 +136,7 @@ class StateManager:
     
     def get_goal_history(self, limit: int = 50) -> List[GoalEvent]:
         """Get recent goal history."""
-        return self._goal_history[-limit:]
+        return _recent(self._goal_history, limit)
     
     # ==================== NFL Game Management ====================
     
@@ -126,7 +155,7 @@ class StateManager:
     
     def get_live_nfl_games(self) -> List[NFLGame]:
         """Get only live NFL games."""
-        return [g for g in self._nfl_games.values() if g.is_live]
+        return [g for g in self._nfl_games.values() if g.status in NFL_LIVE_STATUSES]
     
     def get_previous_nfl_games(self) -> Dict[int, NFLGame]:
         """Get NFL games dict for score detection comparison."""
@@ -155,7 +184,7 @@ class StateManager:
     
     def get_nfl_score_history(self, limit: int = 50) -> List[NFLScoringEvent]:
         """Get recent NFL scoring history."""
-        return self._nfl_score_history[-limit:]
+        return _recent(self._nfl_score_history, limit)
     
     # ==================== Position Management ====================
     
@@ -177,9 +206,16 @@ class StateManager:
         position_id: str,
         exit_price: float,
         exit_order_id: str
-    ) -> Optional[Position]:
-        """Close a position and move to history."""
+    ) -> Tuple[Optional[Position], Optional[Trade]]:
+        """
+        Close a position and move to history.
+        
+        Returns:
+            Tuple of (closed position, oldest open trade on the same match).
+            The trade is handed back for the caller to fill in exit details.
+        """
         position = self._open_positions.pop(position_id, None)
+        trade = None
         if position:
             position.status = PositionStatus.CLOSED
             position.current_price = exit_price
@@ -192,10 +228,16 @@ class StateManager:
             else:
                 position.realized_pnl = (position.entry_price - exit_price) * position.size
             
+            open_trades = self._open_trades.get(position.match_id)
+            if open_trades:
+                trade = open_trades.pop(0)
+                if not open_trades:
+                    del self._open_trades[position.match_id]
+            
             self._closed_positions.append(position)
             self._update_metrics()
         
-        return position
+        return (position, trade)
     
     def update_position_price(self, position_id: str, current_price: float) -> None:
         """Update current price for a position."""
@@ -212,6 +254,8 @@ class StateManager:
     def add_trade(self, trade: Trade) -> None:
         """Record a completed trade."""
         self._trades.append(trade)
+        if trade.exit_time is None:
+            self._open_trades.setdefault(trade.match_id, []).append(trade)
         self._update_metrics()
     
     def get_trades(self, limit: int = 100) -> List[Trade]:
@@ -271,17 +315,9 @@ class StateManager:
     
     def clear_finished_matches(self) -> None:
         """Remove finished matches from tracking."""
-        from core.models import MatchStatus
-        finished_statuses = {
-            MatchStatus.FINISHED,
-            MatchStatus.CANCELLED,
-            MatchStatus.POSTPONED,
-            MatchStatus.ABANDONED
-        }
-        
         to_remove = [
             mid for mid, match in self._matches.items()
-            if match.status in finished_statuses
+            if match.status in _FINISHED_MATCH_STATUSES
         ]
         
         for mid in to_remove:
@@ -293,15 +329,9 @@ class StateManager:
     
     def clear_finished_nfl_games(self) -> None:
         """Remove finished NFL games from tracking."""
-        finished_statuses = {
-            NFLGameStatus.FINAL,
-            NFLGameStatus.CANCELLED,
-            NFLGameStatus.POSTPONED
-        }
-        
         to_remove = [
             gid for gid, game in self._nfl_games.items()
-            if game.status in finished_statuses
+            if game.status in _FINISHED_NFL_STATUSES
         ]
         
         for gid in to_remove:
@@ -324,6 +354,7 @@ class StateManager:
         self._open_positions.clear()
         self._closed_positions.clear()
         self._trades.clear()
+        self._open_trades.clear()
         self._latencies.clear()
         self._slippages.clear()
         self._metrics = TradingMetrics()
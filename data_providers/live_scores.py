@@ -9,6 +9,7 @@ from loguru import logger
 
 from config import settings
 from core.models import Match, Team, MatchStatus, GoalEvent
+from sports.http import decode_json
 
 
 class LiveScoresProvider:
@@ -128,7 +129,7 @@ class LiveScoresProvider:
                 params={"live": "all"}
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             if data.get("errors"):
                 logger.error(f"API-Football errors: {data['errors']}")
@@ -171,7 +172,7 @@ class LiveScoresProvider:
                 params={"date": match_date.isoformat()}
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             if data.get("errors"):
                 logger.error(f"API-Football errors: {data['errors']}")
@@ -213,7 +214,7 @@ class LiveScoresProvider:
                 params={"fixture": match_id}
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             return data.get("response", [])
             
@@ -10,6 +10,7 @@ from typing import List, Optional, Dict, Any
 from loguru import logger
 
 from core.models import NFLGame, NFLTeam, NFLGameStatus, NFLScoringEvent
+from sports.http import decode_json
 
 
 class NFLScoresProvider:
@@ -152,7 +153,7 @@ class NFLScoresProvider:
         try:
             response = await client.get(f"{self.base_url}/scoreboard")
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             games = []
             for event in data.get("events", []):
@@ -183,7 +184,7 @@ class NFLScoresProvider:
         try:
             response = await client.get(f"{self.base_url}/scoreboard")
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             games = [self._parse_game(event) for event in data.get("events", [])]
             logger.info(f"Fetched {len(games)} NFL games for today")
@@ -217,7 +218,7 @@ class NFLScoresProvider:
                 }
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response.content)
             
             games = [self._parse_game(event) for event in data.get("events", [])]
             logger.info(f"Fetched {len(games)} NFL games for week {week}")
@@ -243,6 +244,7 @@ class NFLScoresProvider:
             List of newly detected NFLScoringEvent objects.
         """
         scoring_events = []
+        now = datetime.utcnow()  # one timestamp per poll
         
         for game in current_games:
             prev = previous_games.get(game.id)
@@ -269,7 +271,7 @@ class NFLScoresProvider:
                     event = NFLScoringEvent(
                         id=event_id,
                         game_id=game.id,
-                        timestamp=datetime.utcnow(),
+                        timestamp=now,
                         quarter=game.quarter,
                         clock=game.clock,
                         scoring_team_id=game.home_team.id,
@@ -299,7 +301,7 @@ class NFLScoresProvider:
                     event = NFLScoringEvent(
                         id=event_id,
                         game_id=game.id,
-                        timestamp=datetime.utcnow(),
+                        timestamp=now,
                         quarter=game.quarter,
                         clock=game.clock,
                         scoring_team_id=game.away_team.id,
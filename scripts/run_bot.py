@@ -19,6 +19,13 @@ from services.trade_service import trade_service
 from exchanges.kalshi_client import kalshi_client
 from database import init_db
 
+# Try to import uvloop for a faster event loop (not available on Windows)
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 
 async def main(no_trade: bool = False):
     """Main entry point for the trading bot."""
@@ -110,7 +117,10 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
     
+    # uvicorn already picks uvloop for the API server; do the same here
+    run = uvloop.run if HAS_UVLOOP else asyncio.run
+    
     try:
-        asyncio.run(main(no_trade=args.no_trade))
+        run(main(no_trade=args.no_trade))
     except KeyboardInterrupt:
         print("\nShutdown requested...")
@@ -9,7 +9,7 @@ Tracks:
 - Error rates
 """
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from collections import deque
 from loguru import logger
@@ -120,16 +120,7 @@ class MonitoringService:
         for measurement in reversed(self._latencies):
             if measurement.event_id == event_id:
                 measurement.order_time = order_time
-                
-                latency = measurement.event_to_order_ms
-                if latency:
-                    logger.debug(f"Goal-to-order latency: {latency:.0f}ms")
-                    
-                    if latency > self.max_acceptable_latency_ms:
-                        logger.warning(
-                            f"High latency detected: {latency:.0f}ms > "
-                            f"{self.max_acceptable_latency_ms}ms threshold"
-                        )
+                self._check_order_latency(measurement)
                 break
         
         self._total_orders += 1
@@ -149,7 +140,64 @@ class MonitoringService:
                 measurement.fill_time = fill_time
                 break
         
-        # Record slippage
+        self._record_fill(order_id, expected_price, actual_price)
+    
+    def record_pipeline(self, event_id: str, stages: Dict[str, Any]) -> None:
+        """
+        Record every monitored stage of one event's pipeline in a single call.
+        
+        Replaces the per-stage record_goal_event / record_order_submitted /
+        record_order_filled / record_order_rejected sequence, so the latency
+        measurement is built once instead of searched for at each stage.
+        
+        Args:
+            event_id: The scoring event ID.
+            stages: Stage data. ``event_time`` is required; ``order_time``,
+                ``fill_time`` (with ``order_id``, ``expected_price``,
+                ``actual_price``) and ``rejection_reason`` are recorded
+                when present.
+        """
+        measurement = LatencyMeasurement(
+            event_id=event_id,
+            event_time=stages["event_time"],
+            order_time=stages.get("order_time"),
+            fill_time=stages.get("fill_time")
+        )
+        self._latencies.append(measurement)
+        
+        if measurement.order_time is not None:
+            self._check_order_latency(measurement)
+            self._total_orders += 1
+        
+        if measurement.fill_time is not None:
+            self._record_fill(
+                stages["order_id"],
+                stages["expected_price"],
+                stages["actual_price"]
+            )
+        
+        if "rejection_reason" in stages:
+            self.record_order_rejected(stages["rejection_reason"])
+    
+    def _check_order_latency(self, measurement: LatencyMeasurement) -> None:
+        """Log the goal-to-order latency and warn when it is too high."""
+        latency = measurement.event_to_order_ms
+        if latency:
+            logger.debug(f"Goal-to-order latency: {latency:.0f}ms")
+            
+            if latency > self.max_acceptable_latency_ms:
+                logger.warning(
+                    f"High latency detected: {latency:.0f}ms > "
+                    f"{self.max_acceptable_latency_ms}ms threshold"
+                )
+    
+    def _record_fill(
+        self,
+        order_id: str,
+        expected_price: float,
+        actual_price: float
+    ) -> None:
+        """Record slippage and count a filled order."""
         slippage = SlippageMeasurement(
             order_id=order_id,
             expected_price=expected_price,
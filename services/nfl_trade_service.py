@@ -70,8 +70,8 @@ class NFLTradeService:
         pipeline_start = datetime.utcnow()
         logger.info(f"Processing NFL score: {event.id}")
         
-        # Record scoring event for monitoring
-        monitoring_service.record_goal_event(event.id, event.timestamp)
+        # Monitoring stages, recorded in one batch when the pipeline returns
+        stages = {"event_time": event.timestamp}
         
         try:
             # Step 1: Get or create market mapping
@@ -111,24 +111,23 @@ class NFLTradeService:
             order, exec_message = await order_executor.execute(approved_intent)
             
             # Record order submission for monitoring
-            monitoring_service.record_order_submitted(event.id, datetime.utcnow())
+            stages["order_time"] = datetime.utcnow()
             
             if not order or order.status in (OrderStatus.REJECTED, OrderStatus.CANCELLED):
                 logger.warning(f"Order execution failed: {exec_message}")
                 risk_manager.record_error(exec_message)
-                monitoring_service.record_order_rejected(exec_message)
+                stages["rejection_reason"] = exec_message
                 return None
             
             risk_manager.record_success()
             
             # Record fill for monitoring
             if order.status == OrderStatus.FILLED:
-                monitoring_service.record_order_filled(
-                    event.id,
-                    order.id,
-                    datetime.utcnow(),
-                    approved_intent.limit_price,
-                    order.avg_fill_price or approved_intent.limit_price
+                stages.update(
+                    fill_time=datetime.utcnow(),
+                    order_id=order.id,
+                    expected_price=approved_intent.limit_price,
+                    actual_price=order.avg_fill_price or approved_intent.limit_price
                 )
             
             # Step 5: Create position
@@ -183,6 +182,8 @@ class NFLTradeService:
             logger.error(f"Error processing NFL score {event.id}: {e}")
             risk_manager.record_error(str(e))
             return None
+        finally:
+            monitoring_service.record_pipeline(event.id, stages)
     
     async def close_position(
         self,
@@ -222,7 +223,7 @@ class NFLTradeService:
         
         if order and order.status != OrderStatus.REJECTED:
             exit_price = order.avg_fill_price or position.current_price
-            closed = state_manager.close_position(
+            closed, trade = state_manager.close_position(
                 position_id,
                 exit_price,
                 order.id
@@ -230,16 +231,14 @@ class NFLTradeService:
             
             if closed:
                 # Update trade with exit info
-                for trade in state_manager.get_trades():
-                    if trade.match_id == position.match_id and trade.exit_time is None:
-                        trade.exit_price = exit_price
-                        trade.exit_time = datetime.utcnow()
-                        trade.pnl = closed.realized_pnl
-                        trade.pnl_pct = (
-                            (exit_price - trade.entry_price) / trade.entry_price * 100
-                            if trade.entry_price > 0 else 0
-                        )
-                        break
+                if trade:
+                    trade.exit_price = exit_price
+                    trade.exit_time = datetime.utcnow()
+                    trade.pnl = closed.realized_pnl
+                    trade.pnl_pct = (
+                        (exit_price - trade.entry_price) / trade.entry_price * 100
+                        if trade.entry_price > 0 else 0
+                    )
                 
                 # Record P/L
                 risk_manager.record_trade_result(
@@ -66,8 +66,8 @@ class TradeService:
         pipeline_start = datetime.utcnow()
         logger.info(f"Processing goal: {goal.id}")
         
-        # Record goal event for monitoring
-        monitoring_service.record_goal_event(goal.id, goal.timestamp)
+        # Monitoring stages, recorded in one batch when the pipeline returns
+        stages = {"event_time": goal.timestamp}
         
         try:
             # Step 1: Get or create market mapping
@@ -107,24 +107,23 @@ class TradeService:
             order, exec_message = await order_executor.execute(approved_intent)
             
             # Record order submission for monitoring
-            monitoring_service.record_order_submitted(goal.id, datetime.utcnow())
+            stages["order_time"] = datetime.utcnow()
             
             if not order or order.status in (OrderStatus.REJECTED, OrderStatus.CANCELLED):
                 logger.warning(f"Order execution failed: {exec_message}")
                 risk_manager.record_error(exec_message)
-                monitoring_service.record_order_rejected(exec_message)
+                stages["rejection_reason"] = exec_message
                 return None
             
             risk_manager.record_success()
             
             # Record fill for monitoring
             if order.status == OrderStatus.FILLED:
-                monitoring_service.record_order_filled(
-                    goal.id,
-                    order.id,
-                    datetime.utcnow(),
-                    approved_intent.limit_price,
-                    order.avg_fill_price or approved_intent.limit_price
+                stages.update(
+                    fill_time=datetime.utcnow(),
+                    order_id=order.id,
+                    expected_price=approved_intent.limit_price,
+                    actual_price=order.avg_fill_price or approved_intent.limit_price
                 )
             
             # Step 5: Create position
@@ -179,6 +178,8 @@ class TradeService:
             logger.error(f"Error processing goal {goal.id}: {e}")
             risk_manager.record_error(str(e))
             return None
+        finally:
+            monitoring_service.record_pipeline(goal.id, stages)
     
     async def close_position(
         self,
@@ -218,7 +219,7 @@ class TradeService:
         
         if order and order.status != OrderStatus.REJECTED:
             exit_price = order.avg_fill_price or position.current_price
-            closed = state_manager.close_position(
+            closed, trade = state_manager.close_position(
                 position_id,
                 exit_price,
                 order.id
@@ -226,16 +227,14 @@ class TradeService:
             
             if closed:
                 # Update trade with exit info
-                for trade in state_manager.get_trades():
-                    if trade.match_id == position.match_id and trade.exit_time is None:
-                        trade.exit_price = exit_price
-                        trade.exit_time = datetime.utcnow()
-                        trade.pnl = closed.realized_pnl
-                        trade.pnl_pct = (
-                            (exit_price - trade.entry_price) / trade.entry_price * 100
-                            if trade.entry_price > 0 else 0
-                        )
-                        break
+                if trade:
+                    trade.exit_price = exit_price
+                    trade.exit_time = datetime.utcnow()
+                    trade.pnl = closed.realized_pnl
+                    trade.pnl_pct = (
+                        (exit_price - trade.entry_price) / trade.entry_price * 100
+                        if trade.entry_price > 0 else 0
+                    )
                 
                 # Record P/L
                 risk_manager.record_trade_result(
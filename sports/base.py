@@ -4,9 +4,10 @@ Base classes for multi-sport trading architecture.
 All sports implement these interfaces for consistent behavior.
 """
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Tuple
-from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Any, Tuple, Hashable
 from enum import Enum
 
 
@@ -20,7 +21,13 @@ class GameStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class BaseTeam(BaseModel):
+def score_leader(home_score: int, away_score: int) -> int:
+    """Return which side leads: 1 for home, -1 for away, 0 when tied."""
+    return (home_score > away_score) - (home_score < away_score)
+
+
+@dataclass(frozen=True, slots=True)
+class BaseTeam:
     """Base team model for all sports."""
     id: int
     name: str
@@ -28,8 +35,14 @@ class BaseTeam(BaseModel):
     logo: Optional[str] = None
 
 
-class BaseGame(BaseModel):
-    """Base game model for all sports."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BaseGame:
+    """
+    Base game model for all sports.
+    
+    Plain dataclass rather than a pydantic model: games are rebuilt from
+    provider JSON on every poll, and the provider already coerces each field.
+    """
     id: int
     sport: str
     home_team: BaseTeam
@@ -48,6 +61,14 @@ class BaseGame(BaseModel):
     home_odds: Optional[float] = None
     away_odds: Optional[float] = None
     
+    # Team ids lifted out of the nested teams for the decision hot path
+    home_id: int = field(init=False, repr=False, compare=False)
+    away_id: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "home_id", self.home_team.id)
+        object.__setattr__(self, "away_id", self.away_team.id)
+    
     @property
     def display_name(self) -> str:
         return f"{self.away_team.name} @ {self.home_team.name}"
@@ -57,10 +78,9 @@ class BaseGame(BaseModel):
         return self.status == GameStatus.IN_PROGRESS
 
 
-class BaseScoringEvent(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BaseScoringEvent:
     """Base scoring event for all sports."""
-    model_config = {"frozen": True}
-    
     id: str
     game_id: int
     sport: str
@@ -75,23 +95,83 @@ class BaseScoringEvent(BaseModel):
     home_score: int
     away_score: int
     
+    # Derived once from the score for the decision engines
+    differential: int = field(init=False, repr=False, compare=False)
+    leader: int = field(init=False, repr=False, compare=False)  # 1=home, -1=away, 0=tie
+    
+    def __post_init__(self):
+        object.__setattr__(self, "differential", abs(self.home_score - self.away_score))
+        object.__setattr__(self, "leader", score_leader(self.home_score, self.away_score))
+    
     @property
     def score_display(self) -> str:
         return f"{self.home_score}-{self.away_score}"
 
 
-class BaseGameMarketMapping(BaseModel):
+@dataclass(slots=True)
+class BaseGameMarketMapping:
     """Maps a game to exchange markets."""
     game_id: int
     sport: str
     home_team_name: str
     away_team_name: str
     start_time: datetime
-    markets: List[Any] = []
+    markets: List[Any] = field(default_factory=list)
     pre_event_home_prob: Optional[float] = None
     pre_event_away_prob: Optional[float] = None
     spread: Optional[float] = None
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = field(default_factory=datetime.utcnow)
+
+
+class BoundedSet:
+    """
+    Set with a fixed capacity that evicts its least recently used entries.
+    
+    Used for seen-event dedup so providers don't grow without bound
+    over a season. Lookups and evictions are counted so the capacity can
+    be sized from real traffic.
+    """
+    
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._items: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __contains__(self, item: Hashable) -> bool:
+        if item in self._items:
+            self._items.move_to_end(item)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def add(self, item: Hashable) -> None:
+        """Add an item, evicting the least recently used one when full."""
+        if item in self._items:
+            self._items.move_to_end(item)
+            return
+        self._items[item] = None
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        self._items.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Get lookup and eviction counters."""
+        return {
+            "size": len(self._items),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
 
 
 class BaseDataProvider(ABC):
@@ -121,6 +201,11 @@ class BaseDataProvider(ABC):
     async def close(self):
         """Cleanup resources."""
         pass
+    
+    def get_dedup_stats(self) -> Dict[str, int]:
+        """Get seen-event cache counters, if the provider keeps one."""
+        seen = getattr(self, "_seen_events", None)
+        return seen.stats() if isinstance(seen, BoundedSet) else {}
 
 
 class BaseDecisionEngine(ABC):
@@ -163,7 +248,7 @@ class BaseDecisionEngine(ABC):
     
     def check_score_differential(self, game: BaseGame, event: BaseScoringEvent) -> Tuple[bool, str]:
         """Check if game is competitive. Override per sport."""
-        diff = abs(event.home_score - event.away_score)
+        diff = event.differential
         if diff > 30:
             return (False, f"Blowout ({diff} point differential)")
         return (True, f"Competitive game ({diff} point differential)")
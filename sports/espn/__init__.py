@@ -0,0 +1,4 @@
+# ESPN scoreboard support shared by the ESPN-backed sports
+from .base import ESPNDataProvider
+
+__all__ = ["ESPNDataProvider"]
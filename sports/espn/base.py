@@ -0,0 +1,211 @@
+"""
+Shared ESPN scoreboard provider.
+
+ESPN's site API serves every sport's scoreboard in the same shape, so
+fetching, status mapping and game parsing live here once. Sport modules
+subclass ESPNDataProvider and only add their scoring detection.
+"""
+import sys
+from collections import OrderedDict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, List, Dict, Optional, Tuple
+from loguru import logger
+
+from sports.base import BaseDataProvider, BaseGame, BaseTeam, GameStatus, BoundedSet
+from sports.http import fetch_json, parse_iso
+
+# ESPN status.type.state -> GameStatus
+_STATE_MAP = MappingProxyType({
+    "pre": GameStatus.SCHEDULED,
+    "in": GameStatus.IN_PROGRESS,
+    "post": GameStatus.FINAL,
+})
+
+# Substring of status.type.name -> GameStatus, for states outside _STATE_MAP
+_STATUS_NAME_MAP = (
+    ("HALFTIME", GameStatus.HALFTIME),
+    ("POSTPONED", GameStatus.POSTPONED),
+    ("CANCELED", GameStatus.CANCELLED),
+)
+
+
+class ESPNDataProvider(BaseDataProvider):
+    """
+    Fetches live data for one sport from the ESPN API.
+    
+    Subclasses set sport_name and espn_path (e.g. "baseball/mlb") and
+    implement detect_scoring_events.
+    """
+    
+    api_base = "https://site.api.espn.com/apis/site/v2/sports"
+    espn_path: str = ""
+    
+    # Parsed games kept per event id across polls
+    EVENT_CACHE_SIZE = 512
+    
+    def __init__(self):
+        self.base_url = f"{self.api_base}/{self.espn_path}"
+        self._seen_events = BoundedSet()
+        # live flag -> (scoreboard payload, games parsed from it)
+        self._parsed: Dict[bool, Tuple[Any, List[BaseGame]]] = {}
+        # event id -> (hash of the fields that change in play, parsed game)
+        self._event_cache: "OrderedDict[str, Tuple[int, BaseGame]]" = OrderedDict()
+    
+    def _parse_status(self, status_data: Dict) -> GameStatus:
+        """Convert ESPN status to GameStatus."""
+        status_type = status_data.get("type", {})
+        status = _STATE_MAP.get(status_type.get("state"))
+        if status is not None:
+            return status
+        
+        status_name = status_type.get("name", "")
+        for marker, status in _STATUS_NAME_MAP:
+            if marker in status_name:
+                return status
+        
+        return GameStatus.SCHEDULED
+    
+    def _event_is_live(self, event_data: Dict) -> bool:
+        """Peek at the raw state so non-live events skip the full parse."""
+        return event_data.get("status", {}).get("type", {}).get("state") == "in"
+    
+    def _parse_team(self, competitor: Optional[Dict]) -> BaseTeam:
+        """Parse one ESPN competitor into BaseTeam."""
+        if not competitor:
+            return BaseTeam(id=0, name="Unknown", abbreviation="")
+        
+        team = competitor.get("team", {})
+        return BaseTeam(
+            id=int(team.get("id") or 0),
+            name=sys.intern(team.get("displayName") or "Unknown"),
+            abbreviation=sys.intern(team.get("abbreviation") or ""),
+            logo=team.get("logo")
+        )
+    
+    def _parse_game(self, event_data: Dict) -> BaseGame:
+        """Parse ESPN event data into BaseGame."""
+        competition = event_data.get("competitions", [{}])[0]
+        competitors = competition.get("competitors", [])
+        
+        by_side = {c.get("homeAway"): c for c in competitors}
+        home_data = by_side.get("home")
+        away_data = by_side.get("away")
+        
+        status_data = event_data.get("status", {})
+        start_time = parse_iso(event_data.get("date", "")) or datetime.now(timezone.utc)
+        
+        # Get odds
+        odds_data = competition.get("odds", [{}])
+        spread = over_under = None
+        if odds_data and odds_data[0]:
+            odds = odds_data[0]
+            spread = float(odds.get("spread", 0)) if odds.get("spread") else None
+            over_under = float(odds.get("overUnder", 0)) if odds.get("overUnder") else None
+        
+        return BaseGame(
+            id=int(event_data["id"]),
+            sport=self.sport_name,
+            home_team=self._parse_team(home_data),
+            away_team=self._parse_team(away_data),
+            home_score=int(home_data.get("score") or 0) if home_data else 0,
+            away_score=int(away_data.get("score") or 0) if away_data else 0,
+            status=self._parse_status(status_data),
+            period=status_data.get("period", 0),
+            clock=status_data.get("displayClock", ""),
+            start_time=start_time,
+            venue=competition.get("venue", {}).get("fullName"),
+            spread=spread,
+            over_under=over_under
+        )
+    
+    def _event_key(self, event_data: Dict) -> int:
+        """Hash the raw fields that change while an event is played."""
+        status_data = event_data.get("status", {})
+        status_type = status_data.get("type", {})
+        competition = event_data.get("competitions", [{}])[0]
+        odds_data = competition.get("odds") or [{}]
+        odds = odds_data[0] or {}
+        return hash((
+            status_type.get("state"),
+            status_type.get("name"),
+            status_data.get("period"),
+            status_data.get("displayClock"),
+            event_data.get("date"),
+            tuple(
+                (c.get("homeAway"), c.get("score"))
+                for c in competition.get("competitors", [])
+            ),
+            odds.get("spread"),
+            odds.get("overUnder"),
+        ))
+    
+    def _cached_parse(self, event_data: Dict) -> BaseGame:
+        """
+        Parse an event, reusing the previous BaseGame if it is unchanged.
+        
+        Most events on a scoreboard are identical between polls, so only
+        the ones whose score, clock, status or odds moved are re-parsed.
+        """
+        event_id = event_data["id"]
+        key = self._event_key(event_data)
+        cached = self._event_cache.get(event_id)
+        if cached and cached[0] == key:
+            self._event_cache.move_to_end(event_id)
+            return cached[1]
+        
+        game = self._parse_game(event_data)
+        self._event_cache[event_id] = (key, game)
+        self._event_cache.move_to_end(event_id)
+        if len(self._event_cache) > self.EVENT_CACHE_SIZE:
+            self._event_cache.popitem(last=False)
+        return game
+    
+    def _games_from(self, data: Any, live: bool) -> List[BaseGame]:
+        """
+        Parse scoreboard events into games.
+        
+        fetch_json returns the same payload object when the scoreboard is
+        unchanged, in which case the previous parse is reused.
+        """
+        cached = self._parsed.get(live)
+        if cached and cached[0] is data:
+            return list(cached[1])
+        
+        events = data.get("events", [])
+        if live:
+            games = [self._cached_parse(e) for e in events if self._event_is_live(e)]
+        else:
+            games = [self._cached_parse(e) for e in events]
+        self._parsed[live] = (data, games)
+        return list(games)
+    
+    async def get_live_games(self) -> List[BaseGame]:
+        """Fetch all currently live games."""
+        try:
+            data = await fetch_json(f"{self.base_url}/scoreboard")
+            games = self._games_from(data, live=True)
+            logger.info("Fetched {} live {} games", len(games), self.sport_name.upper())
+            return games
+        
+        except Exception as e:
+            logger.error(f"Error fetching {self.sport_name.upper()} games: {e}")
+            return []
+    
+    async def get_games_today(self) -> List[BaseGame]:
+        """Fetch all games for today."""
+        try:
+            data = await fetch_json(f"{self.base_url}/scoreboard")
+            games = self._games_from(data, live=False)
+            logger.info("Fetched {} {} games for today", len(games), self.sport_name.upper())
+            return games
+        
+        except Exception as e:
+            logger.error(f"Error fetching {self.sport_name.upper()} games: {e}")
+            return []
+    
+    def clear_cache(self):
+        """Clear seen events cache."""
+        self._seen_events.clear()
+        self._parsed.clear()
+        self._event_cache.clear()
@@ -0,0 +1,120 @@
+"""
+Shared HTTP helpers for sport data providers.
+"""
+import hashlib
+import importlib.util
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+import httpx
+from loguru import logger
+
+# Try to import orjson for faster scoreboard decoding
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    logger.debug("orjson not installed - falling back to stdlib json")
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); only its presence matters
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+if not HAS_HTTP2:
+    logger.debug("h2 not installed - sport providers will use HTTP/1.1")
+
+# Keep idle connections around between polls so each poll skips the TLS handshake
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+
+_client: Optional[httpx.AsyncClient] = None
+
+# url -> (etag, last-modified, body digest, decoded body) from the last 200 response
+_validators: Dict[str, Tuple[Optional[str], Optional[str], bytes, Any]] = {}
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client shared by all sport providers.
+    
+    One pooled client keeps connections to the ESPN host alive across
+    polls and sports instead of re-handshaking per provider. Providers
+    that need auth pass their headers per request.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=POOL_LIMITS
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _validators.clear()
+
+
+async def fetch_json(url: str) -> Any:
+    """
+    GET and decode a JSON resource using a conditional request.
+    
+    Validators from the previous 200 are sent back as If-None-Match /
+    If-Modified-Since; on a 304 the previously decoded body is returned
+    without downloading or decoding it again. A 200 whose body hashes
+    the same as last time also reuses the decoded body, so callers can
+    detect an unchanged payload by identity.
+    """
+    cached = _validators.get(url)
+    headers = {}
+    if cached:
+        etag, last_modified, _, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    response = await get_client().get(url, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[3]
+    response.raise_for_status()
+    
+    digest = hashlib.blake2b(response.content, digest_size=16).digest()
+    if cached and cached[2] == digest:
+        data = cached[3]
+    else:
+        data = decode_json(response.content)
+    _validators[url] = (
+        response.headers.get("etag"),
+        response.headers.get("last-modified"),
+        digest,
+        data
+    )
+    return data
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=1024)
+def parse_iso(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 timestamp such as a scoreboard start time.
+    
+    Start times repeat on every poll, so results are memoized. Empty or
+    malformed values return None (also memoized) instead of raising.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
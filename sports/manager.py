@@ -5,10 +5,11 @@ Handles registration, polling, and event routing for multiple sports.
 """
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Awaitable
+from typing import Dict, List, Optional, Callable, Awaitable, Tuple
 from loguru import logger
 
 from sports.base import BaseSport, BaseGame, BaseScoringEvent, BaseDataProvider, BaseDecisionEngine
+from sports.http import close_client
 
 
 class SportsManager:
@@ -18,13 +19,15 @@ class SportsManager:
     Handles:
     - Sport registration
     - Unified polling across all sports
-    - Event routing to callbacks
+    - Event routing to callbacks and subscriber queues
     """
     
     def __init__(self):
         self._sports: Dict[str, BaseSport] = {}
         self._previous_games: Dict[str, Dict[int, BaseGame]] = {}
+        self._cached_games: Dict[str, Tuple[BaseGame, ...]] = {}
         self._callbacks: List[Callable[[BaseScoringEvent, BaseGame, str], Awaitable[None]]] = []
+        self._subscribers: List[asyncio.Queue] = []
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self.poll_interval = 30  # seconds
@@ -39,6 +42,7 @@ class SportsManager:
         sport = BaseSport(name, provider, decision_engine)
         self._sports[name] = sport
         self._previous_games[name] = {}
+        self._cached_games[name] = ()
         logger.info(f"Registered sport: {name}")
     
     def get_sport(self, name: str) -> Optional[BaseSport]:
@@ -79,13 +83,35 @@ class SportsManager:
         self._callbacks.append(callback)
         logger.info(f"Registered scoring callback: {callback.__name__}")
     
+    def subscribe(self, maxsize: int = 100) -> asyncio.Queue:
+        """
+        Subscribe to scoring events across all sports.
+        
+        Returns a queue of (event, game, sport_name) tuples, so consumers
+        can await the next event rather than polling on an interval.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._subscribers.append(queue)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering scoring events to a subscriber queue."""
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+    
     async def _notify_callbacks(
         self,
         event: BaseScoringEvent,
         game: BaseGame,
         sport_name: str
     ) -> None:
-        """Notify all callbacks of a scoring event."""
+        """Notify all callbacks and subscribers of a scoring event."""
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait((event, game, sport_name))
+            except asyncio.QueueFull:
+                logger.warning(f"Dropping {sport_name} event {event.id}: subscriber queue full")
+        
         for callback in self._callbacks:
             try:
                 await callback(event, game, sport_name)
@@ -112,7 +138,9 @@ class SportsManager:
                 )
             
             # Update state
-            self._previous_games[sport.name] = {g.id: g for g in current_games}
+            games = {g.id: g for g in current_games}
+            self._previous_games[sport.name] = games
+            self._cached_games[sport.name] = tuple(games.values())
             
             return events
             
@@ -120,32 +148,40 @@ class SportsManager:
             logger.error(f"Error polling {sport.name}: {e}")
             return []
     
+    def _count_enabled_games(self) -> int:
+        """Count games in the last snapshot across enabled sports."""
+        return sum(
+            len(self._previous_games.get(s, {}))
+            for s in self.get_enabled_sports()
+        )
+    
     async def _poll_loop(self) -> None:
         """Main polling loop for all sports."""
         logger.info(f"Sports manager started (polling every {self.poll_interval}s)")
         
         while self._running:
             try:
-                # Poll all enabled sports
-                for sport_name, sport in self._sports.items():
-                    if not sport.enabled:
+                # Poll all enabled sports concurrently
+                sports = [s for s in self._sports.values() if s.enabled]
+                results = await asyncio.gather(*(self._poll_sport(s) for s in sports))
+                
+                for sport, events in zip(sports, results):
+                    if not events:
                         continue
                     
-                    events = await self._poll_sport(sport)
-                    
                     # Process events
+                    games = self._previous_games[sport.name]
                     for event in events:
-                        game = self._previous_games[sport_name].get(event.game_id)
+                        game = games.get(event.game_id)
                         if game:
-                            await self._notify_callbacks(event, game, sport_name)
+                            await self._notify_callbacks(event, game, sport.name)
                 
-                # Log status
-                enabled = self.get_enabled_sports()
-                total_games = sum(
-                    len(self._previous_games.get(s, {}))
-                    for s in enabled
+                # Log status (only computed when DEBUG logging is enabled)
+                logger.opt(lazy=True).debug(
+                    "Polled {} sports, {} games",
+                    lambda: len(self.get_enabled_sports()),
+                    self._count_enabled_games
                 )
-                logger.debug(f"Polled {len(enabled)} sports, {total_games} games")
                 
             except Exception as e:
                 logger.error(f"Error in sports manager poll: {e}")
@@ -177,6 +213,7 @@ class SportsManager:
         # Close all providers
         for sport in self._sports.values():
             await sport.data_provider.close()
+        await close_client()
         
         logger.info("Sports manager stopped")
     
@@ -186,12 +223,20 @@ class SportsManager:
     
     async def get_all_live_games(self) -> Dict[str, List[BaseGame]]:
         """Get all live games across all sports."""
-        result = {}
-        for sport_name, sport in self._sports.items():
-            if sport.enabled:
-                games = await sport.data_provider.get_live_games()
-                result[sport_name] = games
-        return result
+        sports = {name: s for name, s in self._sports.items() if s.enabled}
+        results = await asyncio.gather(
+            *(s.data_provider.get_live_games() for s in sports.values()),
+            return_exceptions=True
+        )
+        
+        # A failing provider blanks only its own sport
+        live_games = {}
+        for sport_name, games in zip(sports, results):
+            if isinstance(games, BaseException):
+                logger.error(f"Error getting live {sport_name} games: {games}")
+                games = []
+            live_games[sport_name] = games
+        return live_games
     
     async def get_games_today(self, sport_name: str) -> List[BaseGame]:
         """Get today's games for a specific sport."""
@@ -200,9 +245,14 @@ class SportsManager:
             return await sport.data_provider.get_games_today()
         return []
     
-    def get_cached_games(self, sport_name: str) -> List[BaseGame]:
-        """Get cached games for a sport (from last poll)."""
-        return list(self._previous_games.get(sport_name, {}).values())
+    def get_cached_games(self, sport_name: str) -> Tuple[BaseGame, ...]:
+        """
+        Get cached games for a sport (from last poll).
+        
+        Returns the immutable snapshot built once per poll, so callers
+        share it instead of copying the game list on every request.
+        """
+        return self._cached_games.get(sport_name, ())
 
 
 # Singleton instance
@@ -15,15 +15,11 @@ class MLBDecisionEngine(BaseDecisionEngine):
         self.max_run_differential = 5
     
     def is_underdog(self, team_id: int, game: BaseGame, mapping: BaseGameMarketMapping) -> Tuple[bool, Optional[float], str]:
-        is_home = team_id == game.home_team.id
+        is_home = team_id == game.home_id
         spread = mapping.spread or game.spread
         if spread is not None:
-            if is_home:
-                is_underdog = spread > 0
-                return (is_underdog, spread, f"Spread: {spread:+.1f}")
-            else:
-                is_underdog = spread < 0
-                return (is_underdog, -spread, f"Spread: {-spread:+.1f}")
+            team_spread = spread if is_home else -spread
+            return (team_spread > 0, team_spread, f"Spread: {team_spread:+.1f}")
         return (not is_home, None, "Away team (default)")
     
     def check_time_remaining(self, game: BaseGame, event: BaseScoringEvent) -> Tuple[bool, str]:
@@ -33,41 +29,35 @@ class MLBDecisionEngine(BaseDecisionEngine):
         return (True, f"Inning {inning}")
     
     def check_score_differential(self, game: BaseGame, event: BaseScoringEvent) -> Tuple[bool, str]:
-        diff = abs(event.home_score - event.away_score)
+        diff = event.differential
         if diff > self.max_run_differential:
             return (False, f"Blowout ({diff} runs)")
         return (True, f"Competitive ({diff} runs)")
     
-    def _check_lead_change(self, event: BaseScoringEvent, game: BaseGame, prev_home: int, prev_away: int) -> bool:
-        """Check if this scoring event caused a lead change."""
-        was_home_leading = prev_home > prev_away
-        was_away_leading = prev_away > prev_home
-        was_tied = prev_home == prev_away
+    def _check_lead_change(self, event: BaseScoringEvent, prev_leader: int) -> bool:
+        """
+        Check if this scoring event caused a lead change.
         
-        now_home_leading = event.home_score > event.away_score
-        now_away_leading = event.away_score > event.home_score
-        
-        if event.is_home_team:
-            return (was_away_leading or was_tied) and now_home_leading
-        else:
-            return (was_home_leading or was_tied) and now_away_leading
+        prev_leader is score_leader() of the previous game snapshot.
+        """
+        scoring_side = 1 if event.is_home_team else -1
+        return event.leader == scoring_side and prev_leader != scoring_side
     
     def should_trade(self, event: BaseScoringEvent, game: BaseGame, mapping: BaseGameMarketMapping) -> Tuple[bool, str]:
-        logger.info(f"Evaluating MLB runs: {event.scoring_team_name} +{event.points_scored}")
+        logger.debug(f"Evaluating MLB runs: {event.scoring_team_name} +{event.points_scored}")
         
-        is_underdog, spread_val, underdog_reason = self.is_underdog(event.scoring_team_id, game, mapping)
-        if not is_underdog:
-            return (False, f"Favorite scored ({underdog_reason})")
+        # Cheapest and most selective gate first: most runs score before the 6th
+        inning = event.period or game.period
+        if inning < self.late_inning_start:
+            return (False, f"Early innings ({inning}th) - waiting for late game")
         
-        time_ok, time_reason = self.check_time_remaining(game, event)
         diff_ok, diff_reason = self.check_score_differential(game, event)
         if not diff_ok:
             return (False, diff_reason)
         
-        # Prefer late inning scoring
-        inning = event.period or game.period
-        if inning < self.late_inning_start:
-            return (False, f"Early innings ({inning}th) - waiting for late game")
+        is_underdog, spread_val, underdog_reason = self.is_underdog(event.scoring_team_id, game, mapping)
+        if not is_underdog:
+            return (False, f"Favorite scored ({underdog_reason})")
         
         return (True, f"Underdog {event.scoring_team_name} scores in {inning}th. {underdog_reason}. {diff_reason}.")
 
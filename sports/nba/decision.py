@@ -32,17 +32,12 @@ class NBADecisionEngine(BaseDecisionEngine):
         mapping: BaseGameMarketMapping
     ) -> Tuple[bool, Optional[float], str]:
         """Determine if team is underdog based on spread."""
-        is_home = team_id == game.home_team.id
+        is_home = team_id == game.home_id
         spread = mapping.spread or game.spread
         
         if spread is not None:
-            if is_home:
-                is_underdog = spread > 0
-                team_spread = spread
-            else:
-                is_underdog = spread < 0
-                team_spread = -spread
-            return (is_underdog, team_spread, f"Spread: {team_spread:+.1f}")
+            team_spread = spread if is_home else -spread
+            return (team_spread > 0, team_spread, f"Spread: {team_spread:+.1f}")
         
         # Default: away team is underdog
         return (not is_home, None, "Away team (default)")
@@ -65,7 +60,7 @@ class NBADecisionEngine(BaseDecisionEngine):
         event: BaseScoringEvent
     ) -> Tuple[bool, str]:
         """Check if game is competitive."""
-        diff = abs(event.home_score - event.away_score)
+        diff = event.differential
         
         if diff > self.max_point_differential:
             return (False, f"Blowout ({diff} pts)")
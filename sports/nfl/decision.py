@@ -33,20 +33,14 @@ class NFLDecisionEngine(BaseDecisionEngine):
         mapping: BaseGameMarketMapping
     ) -> Tuple[bool, Optional[float], str]:
         """Determine if team is underdog based on spread."""
-        is_home = team_id == game.home_team.id
+        is_home = team_id == game.home_id
         spread = mapping.spread or game.spread
         
         if spread is not None:
             # Spread is from home team perspective
             # Negative = home favored, Positive = away favored
-            if is_home:
-                is_underdog = spread > 0
-                team_spread = spread
-            else:
-                is_underdog = spread < 0
-                team_spread = -spread
-            
-            return (is_underdog, team_spread, f"Spread: {team_spread:+.1f}")
+            team_spread = spread if is_home else -spread
+            return (team_spread > 0, team_spread, f"Spread: {team_spread:+.1f}")
         
         # Use probabilities if available
         if mapping.pre_event_home_prob and mapping.pre_event_away_prob:
@@ -77,7 +71,7 @@ class NFLDecisionEngine(BaseDecisionEngine):
         event: BaseScoringEvent
     ) -> Tuple[bool, str]:
         """Check if game is competitive."""
-        diff = abs(event.home_score - event.away_score)
+        diff = event.differential
         
         if diff > self.max_point_differential:
             return (False, f"Blowout ({diff} pts)")
@@ -15,15 +15,11 @@ class NHLDecisionEngine(BaseDecisionEngine):
         self.max_goal_differential = 3
     
     def is_underdog(self, team_id: int, game: BaseGame, mapping: BaseGameMarketMapping) -> Tuple[bool, Optional[float], str]:
-        is_home = team_id == game.home_team.id
+        is_home = team_id == game.home_id
         spread = mapping.spread or game.spread
         if spread is not None:
-            if is_home:
-                is_underdog = spread > 0
-                return (is_underdog, spread, f"Spread: {spread:+.1f}")
-            else:
-                is_underdog = spread < 0
-                return (is_underdog, -spread, f"Spread: {-spread:+.1f}")
+            team_spread = spread if is_home else -spread
+            return (team_spread > 0, team_spread, f"Spread: {team_spread:+.1f}")
         return (not is_home, None, "Away team (default)")
     
     def check_time_remaining(self, game: BaseGame, event: BaseScoringEvent) -> Tuple[bool, str]:
@@ -33,7 +29,7 @@ class NHLDecisionEngine(BaseDecisionEngine):
         return (True, f"Period {period} - good timing")
     
     def check_score_differential(self, game: BaseGame, event: BaseScoringEvent) -> Tuple[bool, str]:
-        diff = abs(event.home_score - event.away_score)
+        diff = event.differential
         if diff > self.max_goal_differential:
             return (False, f"Blowout ({diff} goals)")
         return (True, f"Competitive ({diff} goals)")
@@ -34,7 +34,7 @@ class SoccerDecisionEngine(BaseDecisionEngine):
         mapping: BaseGameMarketMapping
     ) -> Tuple[bool, Optional[float], str]:
         """Determine if team is underdog based on odds."""
-        is_home = team_id == game.home_team.id
+        is_home = team_id == game.home_id
         
         # Use pre-match probabilities if available
         if mapping.pre_event_home_prob and mapping.pre_event_away_prob:
@@ -74,7 +74,7 @@ class SoccerDecisionEngine(BaseDecisionEngine):
         event: BaseScoringEvent
     ) -> Tuple[bool, str]:
         """Check if game is competitive."""
-        diff = abs(event.home_score - event.away_score)
+        diff = event.differential
         
         if diff > 3:
             return (False, f"Blowout game ({diff} goal differential)")
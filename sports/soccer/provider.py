@@ -5,14 +5,29 @@ Free tier: 10 requests/minute, no daily limit.
 Covers: Premier League, La Liga, Bundesliga, Serie A, Ligue 1, Champions League
 """
 import httpx
-from datetime import datetime, date
-from typing import List, Dict, Optional
+from datetime import datetime, date, timezone
+from types import MappingProxyType
+from typing import Any, List, Dict, Optional
 from loguru import logger
 
 from config import settings
 from sports.base import (
-    BaseDataProvider, BaseGame, BaseTeam, BaseScoringEvent, GameStatus
+    BaseDataProvider, BaseGame, BaseTeam, BaseScoringEvent, GameStatus, BoundedSet
 )
+from sports.http import decode_json, get_client, parse_iso
+
+# Football-Data.org match status -> GameStatus
+_STATUS_MAP = MappingProxyType({
+    "SCHEDULED": GameStatus.SCHEDULED,
+    "TIMED": GameStatus.SCHEDULED,
+    "IN_PLAY": GameStatus.IN_PROGRESS,
+    "PAUSED": GameStatus.HALFTIME,
+    "HALFTIME": GameStatus.HALFTIME,
+    "FINISHED": GameStatus.FINAL,
+    "POSTPONED": GameStatus.POSTPONED,
+    "CANCELLED": GameStatus.CANCELLED,
+    "SUSPENDED": GameStatus.POSTPONED,
+})
 
 
 class SoccerDataProvider(BaseDataProvider):
@@ -39,39 +54,11 @@ class SoccerDataProvider(BaseDataProvider):
     def __init__(self):
         self.base_url = "https://api.football-data.org/v4"
         self.api_key = getattr(settings, 'football_data_api_key', '')
-        self._client: Optional[httpx.AsyncClient] = None
-        self._seen_scores: Dict[int, Dict[str, int]] = {}
-        self._seen_events: set = set()
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            headers = {"X-Auth-Token": self.api_key} if self.api_key else {}
-            self._client = httpx.AsyncClient(
-                headers=headers,
-                timeout=30.0
-            )
-        return self._client
-    
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        self._seen_events = BoundedSet()
     
     def _parse_status(self, status: str) -> GameStatus:
         """Convert API status to GameStatus."""
-        status_map = {
-            "SCHEDULED": GameStatus.SCHEDULED,
-            "TIMED": GameStatus.SCHEDULED,
-            "IN_PLAY": GameStatus.IN_PROGRESS,
-            "PAUSED": GameStatus.HALFTIME,
-            "HALFTIME": GameStatus.HALFTIME,
-            "FINISHED": GameStatus.FINAL,
-            "POSTPONED": GameStatus.POSTPONED,
-            "CANCELLED": GameStatus.CANCELLED,
-            "SUSPENDED": GameStatus.POSTPONED,
-        }
-        return status_map.get(status, GameStatus.SCHEDULED)
+        return _STATUS_MAP.get(status, GameStatus.SCHEDULED)
     
     def _parse_game(self, match_data: Dict) -> BaseGame:
         """Parse API match data into BaseGame."""
@@ -82,10 +69,7 @@ class SoccerDataProvider(BaseDataProvider):
         
         # Parse kickoff time
         utc_date = match_data.get("utcDate", "")
-        try:
-            start_time = datetime.fromisoformat(utc_date.replace("Z", "+00:00"))
-        except:
-            start_time = datetime.utcnow()
+        start_time = parse_iso(utc_date) or datetime.now(timezone.utc)
         
         # Determine period based on status
         status = self._parse_status(match_data.get("status", "SCHEDULED"))
@@ -122,30 +106,39 @@ class SoccerDataProvider(BaseDataProvider):
             venue=match_data.get("venue")
         )
     
+    async def _get_matches(self, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch matches across all tracked competitions in one request.
+        
+        Returns None when rate limited.
+        """
+        response = await get_client().get(
+            f"{self.base_url}/matches",
+            params={"competitions": ",".join(self.COMPETITIONS), **params},
+            headers={"X-Auth-Token": self.api_key},
+            timeout=30.0
+        )
+        
+        if response.status_code == 429:
+            logger.warning("Football-Data.org rate limit hit")
+            return None
+        
+        response.raise_for_status()
+        return decode_json(response.content)
+    
     async def get_live_games(self) -> List[BaseGame]:
         """Fetch all currently live soccer matches."""
         if not self.api_key:
             logger.warning("Football-Data.org API key not configured")
             return []
         
-        client = await self._get_client()
-        
         try:
-            # Get today's matches and filter for live ones
-            response = await client.get(
-                f"{self.base_url}/matches",
-                params={"status": "IN_PLAY,PAUSED"}
-            )
-            
-            if response.status_code == 429:
-                logger.warning("Football-Data.org rate limit hit")
+            data = await self._get_matches({"status": "IN_PLAY,PAUSED"})
+            if data is None:
                 return []
             
-            response.raise_for_status()
-            data = response.json()
-            
             games = [self._parse_game(m) for m in data.get("matches", [])]
-            logger.info(f"Fetched {len(games)} live soccer matches")
+            logger.info("Fetched {} live soccer matches", len(games))
             return games
             
         except httpx.HTTPStatusError as e:
@@ -161,24 +154,14 @@ class SoccerDataProvider(BaseDataProvider):
             logger.warning("Football-Data.org API key not configured")
             return []
         
-        client = await self._get_client()
-        
         try:
             today = date.today().isoformat()
-            response = await client.get(
-                f"{self.base_url}/matches",
-                params={"dateFrom": today, "dateTo": today}
-            )
-            
-            if response.status_code == 429:
-                logger.warning("Football-Data.org rate limit hit")
+            data = await self._get_matches({"dateFrom": today, "dateTo": today})
+            if data is None:
                 return []
             
-            response.raise_for_status()
-            data = response.json()
-            
             games = [self._parse_game(m) for m in data.get("matches", [])]
-            logger.info(f"Fetched {len(games)} soccer matches for today")
+            logger.info("Fetched {} soccer matches for today", len(games))
             return games
             
         except Exception as e:
@@ -192,66 +175,63 @@ class SoccerDataProvider(BaseDataProvider):
     ) -> List[BaseScoringEvent]:
         """Detect new goals by comparing game states."""
         events = []
+        previous_get = previous_games.get
+        # Goals detected in one poll share a timestamp
+        now = datetime.utcnow()
         
         for game in current_games:
-            prev = previous_games.get(game.id)
-            if prev is None:
-                self._seen_scores[game.id] = {
-                    "home": game.home_score,
-                    "away": game.away_score
-                }
+            # Only games whose score moved go on to the per-side checks
+            prev = previous_get(game.id)
+            if prev is None or (
+                prev.home_score == game.home_score and prev.away_score == game.away_score
+            ):
                 continue
             
-            # Check for home goal
-            if game.home_score > prev.home_score:
-                event_id = f"soccer-{game.id}-home-{game.home_score}"
-                if event_id not in self._seen_events:
-                    self._seen_events.add(event_id)
-                    events.append(BaseScoringEvent(
-                        id=event_id,
-                        game_id=game.id,
-                        sport="soccer",
-                        timestamp=datetime.utcnow(),
-                        period=game.period,
-                        clock=game.clock,
-                        scoring_team_id=game.home_team.id,
-                        scoring_team_name=game.home_team.name,
-                        is_home_team=True,
-                        points_scored=1,
-                        scoring_type="goal",
-                        home_score=game.home_score,
-                        away_score=game.away_score
-                    ))
-                    logger.info(f"GOAL! {game.home_team.name} scores! {game.home_score}-{game.away_score}")
-            
-            # Check for away goal
-            if game.away_score > prev.away_score:
-                event_id = f"soccer-{game.id}-away-{game.away_score}"
-                if event_id not in self._seen_events:
-                    self._seen_events.add(event_id)
-                    events.append(BaseScoringEvent(
-                        id=event_id,
-                        game_id=game.id,
-                        sport="soccer",
-                        timestamp=datetime.utcnow(),
-                        period=game.period,
-                        clock=game.clock,
-                        scoring_team_id=game.away_team.id,
-                        scoring_team_name=game.away_team.name,
-                        is_home_team=False,
-                        points_scored=1,
-                        scoring_type="goal",
-                        home_score=game.home_score,
-                        away_score=game.away_score
-                    ))
-                    logger.info(f"GOAL! {game.away_team.name} scores! {game.home_score}-{game.away_score}")
+            for is_home, team, score, prev_score in (
+                (True, game.home_team, game.home_score, prev.home_score),
+                (False, game.away_team, game.away_score, prev.away_score),
+            ):
+                if score > prev_score:
+                    event = self._make_event(game, is_home, team, score, now)
+                    if event:
+                        events.append(event)
         
         return events
     
+    def _make_event(
+        self,
+        game: BaseGame,
+        is_home: bool,
+        team: BaseTeam,
+        score: int,
+        now: datetime
+    ) -> Optional[BaseScoringEvent]:
+        """Build the goal event for one side, or None if already seen."""
+        key = (game.id, is_home, score)
+        if key in self._seen_events:
+            return None
+        self._seen_events.add(key)
+        
+        logger.info("GOAL! {} scores! {}-{}", team.name, game.home_score, game.away_score)
+        return BaseScoringEvent(
+            id=f"soccer-{game.id}-{'home' if is_home else 'away'}-{score}",
+            game_id=game.id,
+            sport="soccer",
+            timestamp=now,
+            period=game.period,
+            clock=game.clock,
+            scoring_team_id=team.id,
+            scoring_team_name=team.name,
+            is_home_team=is_home,
+            points_scored=1,
+            scoring_type="goal",
+            home_score=game.home_score,
+            away_score=game.away_score
+        )
+    
     def clear_cache(self):
         """Clear seen events cache."""
         self._seen_events.clear()
-        self._seen_scores.clear()
 
 
 # Singleton instance
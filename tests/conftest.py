@@ -1,24 +1,29 @@
 """
 Pytest configuration and fixtures.
+
+The sample models are built once per session from known-valid values
+with model_construct(), skipping validation; tests that need to change
+one take a model_copy() instead of mutating the shared instance.
 """
 import pytest
 from datetime import datetime
 
 from core.models import (
     Match, Team, GoalEvent, Market, MatchMarketMapping,
-    OrderIntent, OrderSide, MatchStatus
+    OrderIntent, OrderSide, MatchStatus,
+    NFLGame, NFLTeam, NFLGameStatus, NFLGameMarketMapping
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_match():
     """Create a sample match for testing."""
-    return Match(
+    return Match.model_construct(
         id=12345,
         league_id=39,
         league_name="Premier League",
-        home_team=Team(id=1, name="Manchester United"),
-        away_team=Team(id=2, name="Liverpool"),
+        home_team=Team.model_construct(id=1, name="Manchester United"),
+        away_team=Team.model_construct(id=2, name="Liverpool"),
         home_score=0,
         away_score=0,
         status=MatchStatus.FIRST_HALF,
@@ -27,13 +32,13 @@ def sample_match():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_goal_event(sample_match):
     """Create a sample goal event."""
-    return GoalEvent(
+    return GoalEvent.model_construct(
         id="12345-away-1-30",
         match_id=sample_match.id,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime(2024, 1, 15, 15, 30, 0),
         minute=30,
         scoring_team_id=2,  # Liverpool (away)
         scoring_team_name="Liverpool",
@@ -43,10 +48,10 @@ def sample_goal_event(sample_match):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_market():
     """Create a sample market."""
-    return Market(
+    return Market.model_construct(
         id="SOCCER-EPL-MUFC-LIV-WIN",
         exchange="kalshi",
         title="Liverpool to win vs Manchester United",
@@ -58,10 +63,10 @@ def sample_market():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mapping(sample_match, sample_market):
     """Create a sample market mapping."""
-    return MatchMarketMapping(
+    return MatchMarketMapping.model_construct(
         match_id=sample_match.id,
         home_team_name=sample_match.home_team.name,
         away_team_name=sample_match.away_team.name,
@@ -73,10 +78,10 @@ def sample_mapping(sample_match, sample_market):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order_intent(sample_match, sample_market, sample_goal_event):
-    """Create a sample order intent."""
-    return OrderIntent(
+    """Create a sample order intent (frozen; derive variants with model_copy)."""
+    return OrderIntent.model_construct(
         id="intent-123",
         match_id=sample_match.id,
         market_id=sample_market.id,
@@ -88,3 +93,63 @@ def sample_order_intent(sample_match, sample_market, sample_goal_event):
         reason="Underdog Liverpool scored",
         goal_event_id=sample_goal_event.id
     )
+
+
+@pytest.fixture(scope="session")
+def nfl_home_team():
+    """Create the home (favored) NFL team."""
+    return NFLTeam(id=1, name="Kansas City Chiefs", abbreviation="KC")
+
+
+@pytest.fixture(scope="session")
+def nfl_away_team():
+    """Create the away (underdog) NFL team."""
+    return NFLTeam(id=2, name="Las Vegas Raiders", abbreviation="LV")
+
+
+@pytest.fixture(scope="session")
+def nfl_game(nfl_home_team, nfl_away_team):
+    """Create a second-quarter NFL game with the home team favored by 7.5."""
+    return NFLGame(
+        id=12345,
+        home_team=nfl_home_team,
+        away_team=nfl_away_team,
+        home_score=14,
+        away_score=7,
+        status=NFLGameStatus.SECOND_QUARTER,
+        quarter=2,
+        clock="8:30",
+        kickoff=datetime(2024, 1, 1, 12, 0, 0),
+        spread=-7.5,
+        over_under=48.5
+    )
+
+
+@pytest.fixture(scope="session")
+def nfl_market():
+    """Create the underdog NFL win market."""
+    return Market(
+        id="NFL-RAIDERS-WIN",
+        exchange="kalshi",
+        title="Las Vegas Raiders to win",
+        yes_price=0.35,
+        no_price=0.65,
+        yes_volume=500,
+        no_volume=500,
+        status="open"
+    )
+
+
+@pytest.fixture(scope="session")
+def nfl_mapping(nfl_game, nfl_market):
+    """Create an NFL market mapping with pre-score probabilities."""
+    return NFLGameMarketMapping(
+        game_id=nfl_game.id,
+        home_team_name=nfl_game.home_team.name,
+        away_team_name=nfl_game.away_team.name,
+        kickoff=nfl_game.kickoff,
+        markets=[nfl_market],
+        pre_score_home_prob=0.70,
+        pre_score_away_prob=0.30,
+        spread=-7.5
+    )
@@ -5,24 +5,30 @@ import pytest
 from datetime import datetime
 
 from core.decision_engine import DecisionEngine
-from core.models import Match, Team, GoalEvent, Market, MatchMarketMapping, MatchStatus
+from core.models import GoalEvent
+
+# Fixed clock for every timestamp in this module
+NOW = datetime(2024, 1, 15, 15, 30, 0)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Create one configured engine for the module; tests only read it."""
+    engine = DecisionEngine()
+    engine.underdog_threshold = 0.5
+    engine.min_liquidity = 100
+    engine.max_price_after_goal = 0.65
+    engine.min_time_remaining = 15
+    return engine
 
 
 class TestDecisionEngine:
     """Test suite for DecisionEngine."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.engine = DecisionEngine()
-        self.engine.underdog_threshold = 0.5
-        self.engine.min_liquidity = 100
-        self.engine.max_price_after_goal = 0.65
-        self.engine.min_time_remaining = 15
-    
-    def test_is_underdog_away_team(self, sample_match, sample_mapping):
+    def test_is_underdog_away_team(self, engine, sample_match, sample_mapping):
         """Test underdog detection for away team."""
         # Away team (Liverpool) has 0.35 pre-goal prob - should be underdog
-        is_underdog, prob = self.engine.is_underdog(
+        is_underdog, prob = engine.is_underdog(
             team_id=2,  # Liverpool
             match=sample_match,
             mapping=sample_mapping
@@ -31,10 +37,10 @@ class TestDecisionEngine:
         assert is_underdog is True
         assert prob == 0.35
     
-    def test_is_not_underdog_home_team(self, sample_match, sample_mapping):
+    def test_is_not_underdog_home_team(self, engine, sample_match, sample_mapping):
         """Test that favorite is not detected as underdog."""
         # Home team (Man Utd) has 0.55 pre-goal prob - not underdog
-        is_underdog, prob = self.engine.is_underdog(
+        is_underdog, prob = engine.is_underdog(
             team_id=1,  # Man Utd
             match=sample_match,
             mapping=sample_mapping
@@ -43,83 +49,52 @@ class TestDecisionEngine:
         assert is_underdog is False
         assert prob == 0.55
     
-    def test_check_value_has_value(self, sample_market):
-        """Test value detection when price is favorable."""
-        # Market at 0.35, pre-goal was 0.35 - still has value
-        has_value, reason = self.engine.check_value(sample_market, 0.35)
+    @pytest.mark.parametrize("price, expected, substr", [
+        pytest.param(0.35, True, "value", id="has-value"),
+        pytest.param(0.70, False, "too high", id="price-too-high"),
+    ])
+    def test_check_value(self, engine, sample_market, price, expected, substr):
+        """Test value detection against a 0.35 pre-goal probability."""
+        market = sample_market.model_copy(update={"yes_price": price})
         
-        assert has_value is True
-        assert "value" in reason.lower() or "below" in reason.lower()
-    
-    def test_check_value_no_value_high_price(self, sample_market):
-        """Test no value when price is too high."""
-        sample_market.yes_price = 0.70  # Above max threshold
+        has_value, reason = engine.check_value(market, 0.35)
         
-        has_value, reason = self.engine.check_value(sample_market, 0.35)
-        
-        assert has_value is False
-        assert "too high" in reason.lower()
-    
-    def test_check_liquidity_sufficient(self, sample_market):
-        """Test liquidity check with sufficient volume."""
-        has_liquidity, reason = self.engine.check_liquidity(sample_market)
-        
-        assert has_liquidity is True
-        assert "ok" in reason.lower()
+        assert has_value is expected
+        assert substr in reason.lower()
     
-    def test_check_liquidity_insufficient(self, sample_market):
-        """Test liquidity check with insufficient volume."""
-        sample_market.yes_volume = 10
-        sample_market.no_volume = 10
+    @pytest.mark.parametrize("volume, expected, substr", [
+        pytest.param(5000, True, "ok", id="sufficient"),
+        pytest.param(10, False, "insufficient", id="insufficient"),
+    ])
+    def test_check_liquidity(self, engine, sample_market, volume, expected, substr):
+        """Test liquidity check on total yes/no volume."""
+        market = sample_market.model_copy(update={"yes_volume": volume, "no_volume": volume})
         
-        has_liquidity, reason = self.engine.check_liquidity(sample_market)
+        has_liquidity, reason = engine.check_liquidity(market)
         
-        assert has_liquidity is False
-        assert "insufficient" in reason.lower()
+        assert has_liquidity is expected
+        assert substr in reason.lower()
     
-    def test_check_time_remaining_ok(self, sample_match, sample_goal_event):
-        """Test time check with enough time remaining."""
-        sample_goal_event = GoalEvent(
-            id="test",
-            match_id=sample_match.id,
-            timestamp=datetime.utcnow(),
-            minute=30,
-            scoring_team_id=2,
-            scoring_team_name="Liverpool",
-            is_home_team=False,
-            home_score=0,
-            away_score=1
-        )
-        
-        time_ok, reason = self.engine.check_time_remaining(sample_match, sample_goal_event)
-        
-        assert time_ok is True
-        assert "ok" in reason.lower()
-    
-    def test_check_time_remaining_too_late(self, sample_match):
-        """Test time check when too late in match."""
-        late_goal = GoalEvent(
-            id="test-late",
-            match_id=sample_match.id,
-            timestamp=datetime.utcnow(),
-            minute=85,  # Only 5 mins left
-            scoring_team_id=2,
-            scoring_team_name="Liverpool",
-            is_home_team=False,
-            home_score=0,
-            away_score=1
-        )
+    @pytest.mark.parametrize("minute, expected, substr", [
+        pytest.param(30, True, "ok", id="enough-time"),
+        pytest.param(85, False, "not enough", id="too-late"),  # Only 5 mins left
+    ])
+    def test_check_time_remaining(
+        self, engine, sample_match, sample_goal_event, minute, expected, substr
+    ):
+        """Test time check against the goal minute."""
+        goal = sample_goal_event.model_copy(update={"minute": minute})
         
-        time_ok, reason = self.engine.check_time_remaining(sample_match, late_goal)
+        time_ok, reason = engine.check_time_remaining(sample_match, goal)
         
-        assert time_ok is False
-        assert "not enough" in reason.lower()
+        assert time_ok is expected
+        assert substr in reason.lower()
     
     def test_evaluate_goal_generates_intent(
-        self, sample_match, sample_goal_event, sample_mapping
+        self, engine, sample_match, sample_goal_event, sample_mapping
     ):
         """Test that underdog goal generates order intent."""
-        intent = self.engine.evaluate_goal(
+        intent = engine.evaluate_goal(
             sample_goal_event,
             sample_match,
             sample_mapping
@@ -132,14 +107,14 @@ class TestDecisionEngine:
         assert "underdog" in intent.reason.lower()
     
     def test_evaluate_goal_no_intent_for_favorite(
-        self, sample_match, sample_mapping
+        self, engine, sample_match, sample_mapping
     ):
         """Test that favorite goal does not generate intent."""
         # Home team (favorite) scores
         favorite_goal = GoalEvent(
             id="test-fav",
             match_id=sample_match.id,
-            timestamp=datetime.utcnow(),
+            timestamp=NOW,
             minute=30,
             scoring_team_id=1,  # Man Utd (favorite)
             scoring_team_name="Manchester United",
@@ -148,7 +123,7 @@ class TestDecisionEngine:
             away_score=0
         )
         
-        intent = self.engine.evaluate_goal(
+        intent = engine.evaluate_goal(
             favorite_goal,
             sample_match,
             sample_mapping
@@ -2,28 +2,32 @@
 Integration tests for the trading pipeline.
 """
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, patch, MagicMock
+from datetime import datetime, timedelta
 
 from core.models import (
     Match, Team, GoalEvent, Market, MatchMarketMapping,
-    OrderIntent, Order, Position, Trade, MatchStatus, OrderSide, OrderStatus
+    OrderIntent, Position, Trade, MatchStatus, OrderSide
 )
 from core.state import StateManager
 from core.decision_engine import DecisionEngine
 from core.risk_manager import RiskManager
-from services.trade_service import TradeService
+
+# Fixed clock for every timestamp in this module
+NOW = datetime(2024, 1, 15, 15, 30, 0)
 
 
 class TestTradingPipeline:
     """Integration tests for the full trading pipeline."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def state_manager(self):
-        """Fresh state manager for each test."""
-        sm = StateManager()
-        sm.reset()
-        return sm
+        """State manager shared by the module; emptied before every test."""
+        return StateManager()
+    
+    @pytest.fixture(autouse=True)
+    def reset_state(self, state_manager):
+        """Reset the shared state manager so each test starts empty."""
+        state_manager.reset()
     
     @pytest.fixture
     def decision_engine(self):
@@ -43,15 +47,15 @@ class TestTradingPipeline:
         rm.per_match_max_exposure = 200
         return rm
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_match(self):
-        """Sample match fixture."""
-        return Match(
+        """Sample match fixture, shared read-only; model_copy() before changing it."""
+        return Match.model_construct(
             id=99999,
             league_id=39,
             league_name="Premier League",
-            home_team=Team(id=1, name="Arsenal"),
-            away_team=Team(id=2, name="Brentford"),
+            home_team=Team.model_construct(id=1, name="Arsenal"),
+            away_team=Team.model_construct(id=2, name="Brentford"),
             home_score=0,
             away_score=0,
             status=MatchStatus.FIRST_HALF,
@@ -59,13 +63,13 @@ class TestTradingPipeline:
             kickoff=datetime(2024, 1, 15, 15, 0, 0)
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def underdog_goal(self, sample_match):
         """Goal by underdog team."""
-        return GoalEvent(
+        return GoalEvent.model_construct(
             id="99999-away-1-30",
             match_id=sample_match.id,
-            timestamp=datetime.utcnow(),
+            timestamp=NOW,
             minute=30,
             scoring_team_id=2,  # Brentford (away/underdog)
             scoring_team_name="Brentford",
@@ -74,17 +78,17 @@ class TestTradingPipeline:
             away_score=1
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def market_mapping(self, sample_match):
         """Market mapping with underdog having low probability."""
-        return MatchMarketMapping(
+        return MatchMarketMapping.model_construct(
             match_id=sample_match.id,
             home_team_name=sample_match.home_team.name,
             away_team_name=sample_match.away_team.name,
             league_name=sample_match.league_name,
             kickoff=sample_match.kickoff,
             markets=[
-                Market(
+                Market.model_construct(
                     id="SOCCER-EPL-ARS-BRE-WIN",
                     exchange="kalshi",
                     title="Brentford to win vs Arsenal",
@@ -173,7 +177,7 @@ class TestTradingPipeline:
             entry_price=0.30,
             current_price=0.35,
             status="open",
-            opened_at=datetime.utcnow(),
+            opened_at=NOW,
             entry_order_id="order-1"
         )
         
@@ -194,20 +198,63 @@ class TestTradingPipeline:
             entry_price=0.30,
             current_price=0.30,
             status="open",
-            opened_at=datetime.utcnow(),
+            opened_at=NOW,
             entry_order_id="order-2"
         )
         
         state_manager.add_position(position)
         
         # Close with profit
-        closed = state_manager.close_position("pos-2", 0.40, "exit-order")
+        closed, trade = state_manager.close_position("pos-2", 0.40, "exit-order")
         
         assert closed is not None
+        assert trade is None  # No trade recorded for this match
         assert closed.status.value == "closed"
         assert closed.realized_pnl > 0  # Profit
         assert len(state_manager.get_open_positions()) == 0
     
+    def test_close_position_returns_open_trade(self, state_manager):
+        """Test that closing a position hands back the open trade for its match."""
+        position = Position(
+            id="pos-3",
+            match_id=12345,
+            market_id="TEST-MKT",
+            exchange="kalshi",
+            outcome="yes",
+            size=50.0,
+            entry_price=0.30,
+            current_price=0.30,
+            status="open",
+            opened_at=NOW,
+            entry_order_id="order-3"
+        )
+        trade = Trade(
+            id="trade-3",
+            match_id=12345,
+            match_name="Arsenal vs Brentford",
+            market_id="TEST-MKT",
+            exchange="kalshi",
+            outcome="yes",
+            entry_price=0.30,
+            size=50.0,
+            entry_time=NOW,
+            goal_event_id="goal-3",
+            reason="Test trade"
+        )
+        
+        state_manager.add_position(position)
+        state_manager.add_trade(trade)
+        
+        closed, matched = state_manager.close_position("pos-3", 0.40, "exit-order")
+        
+        assert closed is not None
+        assert matched is trade
+        
+        # The trade is only handed out once
+        state_manager.add_position(position.model_copy(update={"id": "pos-4"}))
+        _, matched_again = state_manager.close_position("pos-4", 0.40, "exit-order")
+        assert matched_again is None
+    
     def test_goal_deduplication(self, state_manager, underdog_goal):
         """Test that goals are properly deduplicated."""
         # First time - not processed
@@ -233,8 +280,8 @@ class TestTradingPipeline:
             size=50.0,
             pnl=16.67,
             pnl_pct=33.3,
-            entry_time=datetime.utcnow(),
-            exit_time=datetime.utcnow(),
+            entry_time=NOW,
+            exit_time=NOW,
             goal_event_id="goal-1",
             reason="Test trade"
         )
@@ -253,10 +300,9 @@ class TestMonitoringService:
     def test_latency_tracking(self):
         """Test latency measurement tracking."""
         from services.monitoring import MonitoringService
-        from datetime import timedelta
         
         service = MonitoringService()
-        event_time = datetime.utcnow()
+        event_time = NOW
         order_time = event_time + timedelta(milliseconds=150)  # 150ms later
         
         service.record_goal_event("goal-1", event_time)
@@ -274,14 +320,14 @@ class TestMonitoringService:
         
         # Record some orders
         for i in range(10):
-            service.record_goal_event(f"goal-{i}", datetime.utcnow())
-            service.record_order_submitted(f"goal-{i}", datetime.utcnow())
+            service.record_goal_event(f"goal-{i}", NOW)
+            service.record_order_submitted(f"goal-{i}", NOW)
         
         # 8 fills, 2 rejections
         for i in range(8):
             service.record_order_filled(
                 f"goal-{i}", f"order-{i}",
-                datetime.utcnow(), 0.30, 0.31
+                NOW, 0.30, 0.31
             )
         
         service.record_order_rejected("Test rejection 1")
@@ -293,6 +339,35 @@ class TestMonitoringService:
         assert stats.rejected_orders == 2
         assert stats.fill_rate == 0.8
     
+    def test_record_pipeline(self):
+        """Test recording a filled pipeline in a single call."""
+        from services.monitoring import MonitoringService
+        
+        service = MonitoringService()
+        event_time = NOW
+        
+        service.record_pipeline("goal-1", {
+            "event_time": event_time,
+            "order_time": event_time + timedelta(milliseconds=150),
+            "fill_time": event_time + timedelta(milliseconds=300),
+            "order_id": "order-1",
+            "expected_price": 0.30,
+            "actual_price": 0.31
+        })
+        service.record_pipeline("goal-2", {
+            "event_time": event_time,
+            "order_time": event_time,
+            "rejection_reason": "Test rejection"
+        })
+        service.record_pipeline("goal-3", {"event_time": event_time})
+        
+        stats = service.get_stats()
+        assert stats.total_orders == 2
+        assert stats.filled_orders == 1
+        assert stats.rejected_orders == 1
+        assert stats.avg_event_to_fill_ms >= 300
+        assert round(stats.avg_slippage_bps) == 100
+    
     def test_health_check(self):
         """Test health status reporting."""
         from services.monitoring import MonitoringService
@@ -325,7 +400,7 @@ class TestPostTradeManager:
             entry_price=0.30,
             current_price=0.36,  # 20% gain
             status="open",
-            opened_at=datetime.utcnow(),
+            opened_at=NOW,
             entry_order_id="order-1"
         )
         
@@ -348,12 +423,36 @@ class TestPostTradeManager:
             entry_price=0.30,
             current_price=0.25,  # 16.7% loss
             status="open",
-            opened_at=datetime.utcnow(),
+            opened_at=NOW,
             entry_order_id="order-1"
         )
         
         assert manager.check_stop_loss(position) is True
     
+    def test_exit_reason_uses_given_clock(self):
+        """Test exit reasons for a flat position at a caller-supplied time."""
+        from core.post_trade import PostTradeManager
+        
+        manager = PostTradeManager()
+        manager.max_position_time_mins = 90
+        
+        position = Position(
+            id="pos-1",
+            match_id=12345,
+            market_id="TEST",
+            exchange="kalshi",
+            outcome="yes",
+            size=50.0,
+            entry_price=0.30,
+            current_price=0.30,  # Flat - no price exit
+            status="open",
+            opened_at=NOW,
+            entry_order_id="order-1"
+        )
+        
+        assert manager.get_exit_reason(position, NOW + timedelta(minutes=30)) is None
+        assert manager.get_exit_reason(position, NOW + timedelta(minutes=90)) == "time_exit"
+    
     def test_pnl_calculation(self):
         """Test P/L calculation."""
         from core.post_trade import PostTradeManager
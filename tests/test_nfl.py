@@ -3,15 +3,38 @@ Tests for NFL-specific functionality.
 """
 import pytest
 from datetime import datetime
-from unittest.mock import MagicMock, AsyncMock
+from pydantic import ValidationError
 
 from core.models import (
-    NFLGame, NFLTeam, NFLScoringEvent, NFLGameStatus,
-    NFLGameMarketMapping, Market, OrderSide
+    NFLScoringEvent, NFLGameStatus, OrderSide
 )
 from core.nfl_decision_engine import NFLDecisionEngine
 from core.nfl_mapper import NFLMarketMapper
-from core.state import StateManager
+from core.state import HISTORY_SIZE, StateManager
+
+# Fixed clock for every timestamp in this module
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# A converted Raiders (underdog) touchdown tying the game in Q2
+_EVENT_TEMPLATE = dict(
+    id="test-1",
+    game_id=12345,
+    timestamp=NOW,
+    quarter=2,
+    clock="8:30",
+    scoring_team_id=2,
+    scoring_team_name="Las Vegas Raiders",
+    is_home_team=False,
+    points_scored=7,
+    scoring_type="touchdown_pat",
+    home_score=14,
+    away_score=14
+)
+
+
+def _event(**overrides) -> NFLScoringEvent:
+    """Build a scoring event from the template with the given fields changed."""
+    return NFLScoringEvent(**{**_EVENT_TEMPLATE, **overrides})
 
 
 class TestNFLDecisionEngine:
@@ -20,221 +43,80 @@ class TestNFLDecisionEngine:
     def setup_method(self):
         """Setup test fixtures."""
         self.engine = NFLDecisionEngine()
-        
-        # Create test teams
-        self.home_team = NFLTeam(
-            id=1,
-            name="Kansas City Chiefs",
-            abbreviation="KC"
-        )
-        self.away_team = NFLTeam(
-            id=2,
-            name="Las Vegas Raiders",
-            abbreviation="LV"
-        )
-        
-        # Create test game
-        self.game = NFLGame(
-            id=12345,
-            home_team=self.home_team,
-            away_team=self.away_team,
-            home_score=14,
-            away_score=7,
-            status=NFLGameStatus.SECOND_QUARTER,
-            quarter=2,
-            clock="8:30",
-            kickoff=datetime.utcnow(),
-            spread=-7.5,  # Chiefs favored by 7.5
-            over_under=48.5
-        )
-        
-        # Create test market
-        self.market = Market(
-            id="NFL-RAIDERS-WIN",
-            exchange="kalshi",
-            title="Las Vegas Raiders to win",
-            yes_price=0.35,
-            no_price=0.65,
-            yes_volume=500,
-            no_volume=500,
-            status="open"
-        )
-        
-        # Create test mapping
-        self.mapping = NFLGameMarketMapping(
-            game_id=12345,
-            home_team_name="Kansas City Chiefs",
-            away_team_name="Las Vegas Raiders",
-            kickoff=datetime.utcnow(),
-            markets=[self.market],
-            pre_score_home_prob=0.70,
-            pre_score_away_prob=0.30,
-            spread=-7.5
-        )
-    
-    def test_is_underdog_away_team_with_spread(self):
-        """Test underdog detection for away team with negative spread."""
-        # Raiders are underdogs (Chiefs favored by 7.5)
-        is_underdog, spread_val, reason = self.engine.is_underdog(
-            self.away_team.id, self.game, self.mapping
-        )
-        
-        assert is_underdog is True
-        assert "Spread" in reason
     
-    def test_is_not_underdog_home_team_with_spread(self):
-        """Test that home favorite is not underdog."""
-        # Chiefs are favorites
-        is_underdog, spread_val, reason = self.engine.is_underdog(
-            self.home_team.id, self.game, self.mapping
-        )
-        
-        assert is_underdog is False
+    @pytest.fixture(autouse=True)
+    def bind_fixtures(self, nfl_home_team, nfl_away_team, nfl_game, nfl_market, nfl_mapping):
+        """Bind the shared session models; tests model_copy() them to vary a field."""
+        self.home_team = nfl_home_team
+        self.away_team = nfl_away_team
+        self.game = nfl_game
+        self.market = nfl_market
+        self.mapping = nfl_mapping
     
-    def test_check_value_has_value(self):
-        """Test value detection when price is low."""
-        has_value, reason = self.engine.check_value(
-            self.market, 0.30, is_underdog=True
-        )
+    @pytest.mark.parametrize("side, expected", [
+        pytest.param("away", True, id="away-underdog"),  # Chiefs favored by 7.5
+        pytest.param("home", False, id="home-favorite"),
+    ])
+    def test_is_underdog_with_spread(self, side, expected):
+        """Test spread-based underdog detection for each side."""
+        team = self.away_team if side == "away" else self.home_team
         
-        assert has_value is True
-        assert "Value" in reason or "below 50%" in reason
-    
-    def test_check_value_no_value_high_price(self):
-        """Test no value when price is too high."""
-        high_price_market = Market(
-            id="test",
-            exchange="kalshi",
-            title="Test",
-            yes_price=0.75,
-            no_price=0.25,
-            yes_volume=100,
-            no_volume=100
-        )
-        
-        has_value, reason = self.engine.check_value(
-            high_price_market, 0.30, is_underdog=True
+        is_underdog, spread_val, reason = self.engine.is_underdog(
+            team.id, self.game, self.mapping
         )
         
-        assert has_value is False
-        assert "too high" in reason
+        assert is_underdog is expected
+        assert "Spread" in reason
     
-    def test_check_time_remaining_ok(self):
-        """Test time check passes in early quarters."""
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=2,
-            clock="8:30",
-            scoring_team_id=2,
-            scoring_team_name="Las Vegas Raiders",
-            is_home_team=False,
-            points_scored=7,
-            scoring_type="touchdown_pat",
-            home_score=14,
-            away_score=14
-        )
-        
-        time_ok, reason = self.engine.check_time_remaining(self.game, event)
+    def test_is_underdog_reports_team_spread(self):
+        """Test that the spread is reported from the team's perspective."""
+        verdict = self.engine.is_underdog(self.away_team.id, self.game, self.mapping)
         
-        assert time_ok is True
-        assert "Q2" in reason
+        assert verdict == (True, 7.5, "Spread: +7.5")
     
-    def test_check_time_remaining_too_late(self):
-        """Test time check fails in 4th quarter."""
-        late_game = NFLGame(
-            id=12345,
-            home_team=self.home_team,
-            away_team=self.away_team,
-            home_score=21,
-            away_score=14,
-            status=NFLGameStatus.FOURTH_QUARTER,
-            quarter=4,
-            clock="5:00",
-            kickoff=datetime.utcnow()
-        )
-        
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=4,
-            clock="5:00",
-            scoring_team_id=2,
-            scoring_team_name="Las Vegas Raiders",
-            is_home_team=False,
-            points_scored=7,
-            scoring_type="touchdown_pat",
-            home_score=21,
-            away_score=21
-        )
-        
-        time_ok, reason = self.engine.check_time_remaining(late_game, event)
-        
-        assert time_ok is False
-        assert "Q4" in reason
+    @pytest.mark.parametrize("yes_price, expected, substr", [
+        pytest.param(0.35, True, "Value", id="has-value"),
+        pytest.param(0.75, False, "too high", id="price-too-high"),
+    ])
+    def test_check_value(self, yes_price, expected, substr):
+        """Test value detection against a 0.30 pre-score probability."""
+        market = self.market.model_copy(update={"yes_price": yes_price})
+        
+        has_value, reason = self.engine.check_value(market, 0.30, is_underdog=True)
+        
+        assert has_value is expected
+        assert substr in reason
     
-    def test_check_score_differential_competitive(self):
-        """Test score differential check for competitive game."""
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=2,
-            clock="8:30",
-            scoring_team_id=2,
-            scoring_team_name="Las Vegas Raiders",
-            is_home_team=False,
-            points_scored=7,
-            scoring_type="touchdown_pat",
-            home_score=14,
-            away_score=14
-        )
-        
-        diff_ok, reason = self.engine.check_score_differential(self.game, event)
-        
-        assert diff_ok is True
-        assert "Competitive" in reason or "differential" in reason
+    @pytest.mark.parametrize("status, quarter, clock, expected, substr", [
+        pytest.param(NFLGameStatus.SECOND_QUARTER, 2, "8:30", True, "Q2", id="early"),
+        pytest.param(NFLGameStatus.FOURTH_QUARTER, 4, "5:00", False, "Q4", id="too-late"),
+    ])
+    def test_check_time_remaining(self, status, quarter, clock, expected, substr):
+        """Test that trading stops in the 4th quarter."""
+        game = self.game.model_copy(update={"status": status, "quarter": quarter, "clock": clock})
+        event = _event(quarter=quarter, clock=clock)
+        
+        time_ok, reason = self.engine.check_time_remaining(game, event)
+        
+        assert time_ok is expected
+        assert substr in reason
     
-    def test_check_score_differential_blowout(self):
-        """Test score differential check rejects blowouts."""
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=3,
-            clock="10:00",
-            scoring_team_id=2,
-            scoring_team_name="Las Vegas Raiders",
-            is_home_team=False,
-            points_scored=7,
-            scoring_type="touchdown_pat",
-            home_score=42,
-            away_score=14
-        )
+    @pytest.mark.parametrize("quarter, home_score, expected, substr", [
+        pytest.param(2, 14, True, "Competitive", id="competitive"),
+        pytest.param(3, 42, False, "Blowout", id="blowout"),
+    ])
+    def test_check_score_differential(self, quarter, home_score, expected, substr):
+        """Test that blowouts are rejected."""
+        event = _event(quarter=quarter, home_score=home_score)
         
         diff_ok, reason = self.engine.check_score_differential(self.game, event)
         
-        assert diff_ok is False
-        assert "Blowout" in reason
+        assert diff_ok is expected
+        assert substr in reason
     
     def test_evaluate_scoring_event_generates_intent(self):
         """Test that underdog TD generates order intent."""
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=2,
-            clock="8:30",
-            scoring_team_id=2,  # Raiders (underdog)
-            scoring_team_name="Las Vegas Raiders",
-            is_home_team=False,
-            points_scored=7,
-            scoring_type="touchdown_pat",
-            home_score=14,
-            away_score=14
-        )
+        event = _event()  # Raiders (underdog)
         
         intent = self.engine.evaluate_scoring_event(event, self.game, self.mapping)
         
@@ -244,17 +126,10 @@ class TestNFLDecisionEngine:
     
     def test_evaluate_scoring_event_no_intent_for_favorite(self):
         """Test that favorite TD does not generate intent."""
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=2,
-            clock="8:30",
+        event = _event(
             scoring_team_id=1,  # Chiefs (favorite)
             scoring_team_name="Kansas City Chiefs",
             is_home_team=True,
-            points_scored=7,
-            scoring_type="touchdown_pat",
             home_score=21,
             away_score=7
         )
@@ -265,20 +140,7 @@ class TestNFLDecisionEngine:
     
     def test_evaluate_scoring_event_no_intent_for_field_goal(self):
         """Test that field goal (3 pts) does not generate intent."""
-        event = NFLScoringEvent(
-            id="test-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=2,
-            clock="8:30",
-            scoring_team_id=2,  # Raiders (underdog)
-            scoring_team_name="Las Vegas Raiders",
-            is_home_team=False,
-            points_scored=3,  # Field goal
-            scoring_type="field_goal",
-            home_score=14,
-            away_score=10
-        )
+        event = _event(points_scored=3, scoring_type="field_goal", away_score=10)
         
         intent = self.engine.evaluate_scoring_event(event, self.game, self.mapping)
         
@@ -305,6 +167,14 @@ class TestNFLMarketMapper:
         assert "chiefs" in aliases
         assert "kc" in aliases
     
+    def test_team_aliases_are_memoized(self):
+        """Test that repeat alias lookups reuse one immutable result."""
+        aliases = self.mapper._get_team_aliases("Las Vegas Raiders")
+        
+        assert self.mapper._get_team_aliases("Las Vegas Raiders") is aliases
+        assert isinstance(aliases, tuple)
+        assert "oakland" in aliases
+    
     def test_match_team_in_text(self):
         """Test team matching in market text."""
         score = self.mapper._match_team_in_text(
@@ -328,21 +198,21 @@ class TestNFLStateManager:
     """Tests for NFL state management."""
     
     def setup_method(self):
-        """Setup test fixtures."""
+        """Give each test its own empty state (never the module singleton)."""
         self.state = StateManager()
-        self.state.reset()
+    
+    @pytest.fixture(autouse=True)
+    def bind_game(self, nfl_game):
+        """Bind the shared second-quarter game."""
+        self.game = nfl_game
+    
+    def test_nfl_game_is_frozen(self):
+        """Test that shared game snapshots can only change via model_copy."""
+        with pytest.raises(ValidationError):
+            self.game.home_score = 21
         
-        self.game = NFLGame(
-            id=12345,
-            home_team=NFLTeam(id=1, name="Chiefs", abbreviation="KC"),
-            away_team=NFLTeam(id=2, name="Raiders", abbreviation="LV"),
-            home_score=14,
-            away_score=7,
-            status=NFLGameStatus.SECOND_QUARTER,
-            quarter=2,
-            clock="8:30",
-            kickoff=datetime.utcnow()
-        )
+        assert self.game.model_copy(update={"home_score": 21}).home_score == 21
+        assert self.game.home_score == 14
     
     def test_update_nfl_games(self):
         """Test NFL game state updates."""
@@ -353,17 +223,14 @@ class TestNFLStateManager:
     
     def test_get_live_nfl_games(self):
         """Test filtering for live NFL games."""
-        finished_game = NFLGame(
-            id=99999,
-            home_team=NFLTeam(id=3, name="Bills", abbreviation="BUF"),
-            away_team=NFLTeam(id=4, name="Dolphins", abbreviation="MIA"),
-            home_score=24,
-            away_score=21,
-            status=NFLGameStatus.FINAL,
-            quarter=4,
-            clock="0:00",
-            kickoff=datetime.utcnow()
-        )
+        finished_game = self.game.model_copy(update={
+            "id": 99999,
+            "home_score": 24,
+            "away_score": 21,
+            "status": NFLGameStatus.FINAL,
+            "quarter": 4,
+            "clock": "0:00"
+        })
         
         self.state.update_nfl_games([self.game, finished_game])
         
@@ -371,22 +238,19 @@ class TestNFLStateManager:
         assert len(live_games) == 1
         assert live_games[0].id == 12345
     
+    def test_clear_finished_nfl_games(self):
+        """Test that final games are dropped along with their mappings."""
+        finished_game = self.game.model_copy(update={"id": 99999, "status": NFLGameStatus.FINAL})
+        self.state.update_nfl_games([self.game, finished_game])
+        
+        self.state.clear_finished_nfl_games()
+        
+        assert self.state.get_nfl_game(99999) is None
+        assert self.state.get_nfl_game(12345) is not None
+    
     def test_nfl_score_processing(self):
         """Test NFL score event tracking."""
-        event = NFLScoringEvent(
-            id="test-score-1",
-            game_id=12345,
-            timestamp=datetime.utcnow(),
-            quarter=2,
-            clock="8:30",
-            scoring_team_id=2,
-            scoring_team_name="Raiders",
-            is_home_team=False,
-            points_scored=7,
-            scoring_type="touchdown_pat",
-            home_score=14,
-            away_score=14
-        )
+        event = _event(id="test-score-1")
         
         assert not self.state.is_nfl_score_processed(event.id)
         
@@ -394,3 +258,14 @@ class TestNFLStateManager:
         
         assert self.state.is_nfl_score_processed(event.id)
         assert len(self.state.get_nfl_score_history()) == 1
+    
+    def test_nfl_score_history_returns_latest_oldest_first(self):
+        """Test that history limits keep the newest events in order."""
+        for i in range(5):
+            self.state.mark_nfl_score_processed(_event(id=f"score-{i}"))
+        
+        recent = self.state.get_nfl_score_history(limit=2)
+        
+        assert [e.id for e in recent] == ["score-3", "score-4"]
+        assert len(self.state.get_nfl_score_history(limit=50)) == 5
+        assert self.state._nfl_score_history.maxlen == HISTORY_SIZE
@@ -1,9 +1,7 @@
 """
 Tests for the risk manager.
 """
-import pytest
 from core.risk_manager import RiskManager
-from core.models import OrderIntent, OrderSide
 
 
 class TestRiskManager:
@@ -78,13 +76,14 @@ class TestRiskManager:
     
     def test_approve_trade_sets_size(self, sample_order_intent):
         """Test that approve_trade sets the position size."""
-        sample_order_intent.size = 0  # Start with no size
+        intent = sample_order_intent.model_copy(update={"size": 0})  # Start with no size
         
-        approved, reason = self.rm.approve_trade(sample_order_intent)
+        approved, reason = self.rm.approve_trade(intent)
         
         assert approved is not None
         assert approved.size == 50.0
         assert "approved" in reason.lower()
+        assert intent.size == 0  # Sized on a copy, never in place
     
     def test_record_error_triggers_circuit_breaker(self):
         """Test that consecutive errors trigger circuit breaker."""
@@ -94,6 +93,14 @@ class TestRiskManager:
         assert self.rm._circuit_breaker_active is True
         assert self.rm._consecutive_errors == 5
     
+    def test_record_errors_batch_triggers_circuit_breaker(self):
+        """Test that a burst of errors trips the breaker in one call."""
+        self.rm.record_errors(f"Error {i}" for i in range(5))
+        
+        assert self.rm._circuit_breaker_active is True
+        assert self.rm._consecutive_errors == 5
+        assert self.rm._last_error == "Error 4"
+    
     def test_record_success_resets_errors(self):
         """Test that success resets error counter."""
         self.rm._consecutive_errors = 3
@@ -0,0 +1,620 @@
+"""
+Tests for the multi-sport modules.
+"""
+import dataclasses
+import json
+import httpx
+import pytest
+from datetime import datetime
+
+from sports.base import (
+    BaseGame, BaseTeam, BaseScoringEvent, BaseGameMarketMapping, BoundedSet, GameStatus,
+    score_leader
+)
+import sports.http
+from sports.http import close_client, decode_json, fetch_json, get_client, parse_iso
+from sports.manager import SportsManager
+from sports.mlb.decision import MLBDecisionEngine
+from sports.nba.provider import NBADataProvider
+from sports.nfl.provider import NFLDataProvider
+from sports.nhl.decision import NHLDecisionEngine
+from sports.nhl.provider import NHLDataProvider
+from sports.soccer.provider import SoccerDataProvider
+
+
+@pytest.fixture
+async def mock_http():
+    """
+    Route the shared sports HTTP client through a MockTransport handler.
+    
+    Teardown closes the mock client, clears the conditional-GET cache and
+    restores the previous client even when the test fails.
+    """
+    saved = sports.http._client
+    
+    def install(handler) -> None:
+        sports.http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    yield install
+    await close_client()
+    sports.http._client = saved
+
+
+def make_game(game_id: int = 1, home_score: int = 0, away_score: int = 0, period: int = 1) -> BaseGame:
+    """Build a live NHL game with fixed teams."""
+    return BaseGame(
+        id=game_id,
+        sport="nhl",
+        home_team=BaseTeam(id=10, name="Boston Bruins", abbreviation="BOS"),
+        away_team=BaseTeam(id=20, name="Buffalo Sabres", abbreviation="BUF"),
+        home_score=home_score,
+        away_score=away_score,
+        status=GameStatus.IN_PROGRESS,
+        period=period,
+        clock="12:00",
+        start_time=datetime(2024, 1, 15, 19, 0, 0)
+    )
+
+
+def espn_event(event_id: str = "401", state: str = "in", home_score: str = "2", away_score: str = "1") -> dict:
+    """Build a minimal ESPN scoreboard event."""
+    return {
+        "id": event_id,
+        "date": "2024-01-15T19:00Z",
+        "status": {"type": {"state": state}, "period": 2, "displayClock": "12:00"},
+        "competitions": [{
+            "competitors": [
+                {"homeAway": "home", "score": home_score,
+                 "team": {"id": "10", "displayName": "Boston Bruins", "abbreviation": "BOS"}},
+                {"homeAway": "away", "score": away_score,
+                 "team": {"id": "20", "displayName": "Buffalo Sabres", "abbreviation": "BUF"}}
+            ],
+            "odds": [{"spread": "-1.5", "overUnder": "6.5"}]
+        }]
+    }
+
+
+class TestBaseModels:
+    """Tests for the shared sport data types."""
+    
+    def test_game_is_immutable(self):
+        """Test that games cannot be mutated after construction."""
+        game = make_game()
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            game.home_score = 3
+    
+    def test_game_has_no_instance_dict(self):
+        """Test that games are slotted."""
+        assert not hasattr(make_game(), "__dict__")
+    
+    def test_equal_games_hash_equal(self):
+        """Test that frozen games can key dicts and sets."""
+        assert hash(make_game()) == hash(make_game())
+        assert len({make_game(), make_game(home_score=4)}) == 2
+    
+    def test_game_display_name(self):
+        """Test display name and live flag."""
+        game = make_game()
+        
+        assert game.display_name == "Buffalo Sabres @ Boston Bruins"
+        assert game.is_live is True
+    
+    def test_game_lifts_team_ids(self):
+        """Test that team ids are available directly on the game."""
+        game = make_game()
+        
+        assert game.home_id == 10
+        assert game.away_id == 20
+        assert game == make_game()
+    
+    def test_bounded_set_evicts_least_recent(self):
+        """Test that the seen-event set stays within capacity."""
+        seen = BoundedSet(capacity=2)
+        seen.add("a")
+        seen.add("b")
+        assert "a" in seen
+        seen.add("c")
+        
+        assert len(seen) == 2
+        assert "b" not in seen
+        assert "a" in seen and "c" in seen
+        assert seen.stats() == {"size": 2, "capacity": 2, "hits": 3, "misses": 1, "evictions": 1}
+    
+    def test_decode_json(self):
+        """Test decoding a scoreboard body from raw bytes."""
+        data = decode_json(b'{"events": [{"id": "401"}]}')
+        
+        assert data == {"events": [{"id": "401"}]}
+    
+    def test_parse_iso_memoizes(self):
+        """Test that repeated start times reuse the parsed datetime."""
+        first = parse_iso("2024-01-15T19:00Z")
+        
+        assert first == datetime.fromisoformat("2024-01-15T19:00+00:00")
+        assert parse_iso("2024-01-15T19:00Z") is first
+        assert parse_iso("") is None
+        assert parse_iso("not-a-date") is None
+    
+    async def test_shared_client(self):
+        """Test that providers share one client until it is closed."""
+        client = get_client()
+        
+        assert get_client() is client
+        
+        await close_client()
+        assert client.is_closed
+        assert get_client() is not client
+        await close_client()
+
+
+class TestFetchJson:
+    """Tests for conditional scoreboard fetches."""
+    
+    @pytest.fixture(autouse=True)
+    def serve_scoreboard(self, mock_http):
+        """Set up a client that serves one scoreboard with an ETag."""
+        self.requests = []
+        self.etag = '"v1"'
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if self.etag and request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            headers = {"ETag": self.etag} if self.etag else {}
+            return httpx.Response(200, json={"events": [espn_event()]}, headers=headers)
+        
+        mock_http(handler)
+    
+    async def test_not_modified_reuses_body(self):
+        """Test that a 304 returns the previously decoded body."""
+        first = await fetch_json("https://espn.test/scoreboard")
+        second = await fetch_json("https://espn.test/scoreboard")
+        
+        assert first == {"events": [espn_event()]}
+        assert second is first
+        assert "If-None-Match" not in self.requests[0].headers
+        assert self.requests[1].headers["If-None-Match"] == '"v1"'
+    
+    async def test_unchanged_body_reuses_parse(self):
+        """Test that an identical body without validators skips decode and parse."""
+        self.etag = None
+        provider = NHLDataProvider()
+        
+        first = await provider.get_live_games()
+        data = sports.http._validators[f"{provider.base_url}/scoreboard"][3]
+        second = await provider.get_live_games()
+        
+        assert await fetch_json(f"{provider.base_url}/scoreboard") is data
+        assert [g.id for g in first] == [401]
+        assert second == first
+        assert second[0] is first[0]
+
+
+class TestNHLDataProvider:
+    """Tests for NHL scoring detection."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = NHLDataProvider()
+    
+    def test_event_is_live(self):
+        """Test the raw status peek used to skip non-live events."""
+        assert self.provider._event_is_live({"status": {"type": {"state": "in"}}}) is True
+        assert self.provider._event_is_live({"status": {"type": {"state": "post"}}}) is False
+        assert self.provider._event_is_live({}) is False
+    
+    def test_parse_game(self):
+        """Test parsing an ESPN event into a game."""
+        game = self.provider._parse_game(espn_event())
+        
+        assert game.id == 401
+        assert game.status == GameStatus.IN_PROGRESS
+        assert (game.home_id, game.away_id) == (10, 20)
+        assert (game.home_score, game.away_score) == (2, 1)
+        assert game.spread == -1.5
+    
+    def test_parse_game_away_listed_first(self):
+        """Test that competitors are matched by side, not position."""
+        event = espn_event()
+        event["competitions"][0]["competitors"].reverse()
+        
+        game = self.provider._parse_game(event)
+        
+        assert (game.home_id, game.away_id) == (10, 20)
+    
+    def test_parse_game_tolerates_missing_fields(self):
+        """Test defaults for a missing competitor, score and start time."""
+        event = espn_event()
+        del event["date"]
+        competitors = event["competitions"][0]["competitors"]
+        competitors.pop()
+        competitors[0]["score"] = ""
+        
+        game = self.provider._parse_game(event)
+        
+        assert game.away_team.name == "Unknown"
+        assert game.home_score == 0
+        assert game.start_time.tzinfo is not None
+    
+    def test_parse_game_interns_team_strings(self):
+        """Test that team strings are shared across polls."""
+        first = self.provider._parse_game(decode_json(json.dumps(espn_event()).encode()))
+        second = self.provider._parse_game(decode_json(json.dumps(espn_event()).encode()))
+        
+        assert first.home_team.abbreviation is second.home_team.abbreviation
+        assert first.away_team.name is second.away_team.name
+    
+    async def test_detect_away_goal(self):
+        """Test that an away goal produces one scoring event."""
+        previous = {1: make_game(home_score=1, away_score=0)}
+        current = [make_game(home_score=1, away_score=1)]
+        
+        events = await self.provider.detect_scoring_events(previous, current)
+        
+        assert len(events) == 1
+        assert isinstance(events[0], BaseScoringEvent)
+        assert events[0].scoring_team_id == 20
+        assert events[0].is_home_team is False
+        assert events[0].score_display == "1-1"
+        assert events[0].id == "nhl-1-away-1"
+    
+    async def test_detect_ignores_new_games(self):
+        """Test that games without a previous snapshot emit nothing."""
+        events = await self.provider.detect_scoring_events({}, [make_game(away_score=2)])
+        
+        assert events == []
+    
+    async def test_detect_deduplicates_events(self):
+        """Test that the same score change is only reported once."""
+        previous = {1: make_game(home_score=0)}
+        current = [make_game(home_score=1)]
+        
+        first = await self.provider.detect_scoring_events(previous, current)
+        second = await self.provider.detect_scoring_events(previous, current)
+        
+        assert len(first) == 1
+        assert second == []
+        assert self.provider.get_dedup_stats()["hits"] == 1
+
+
+class TestESPNDataProvider:
+    """Tests for the shared ESPN provider behaviour."""
+    
+    def test_sport_urls(self):
+        """Test that each sport builds its scoreboard base URL."""
+        assert NHLDataProvider().base_url.endswith("/sports/hockey/nhl")
+        assert NFLDataProvider().base_url.endswith("/sports/football/nfl")
+    
+    def test_parse_game_uses_sport_name(self):
+        """Test that parsed games are tagged with the provider's sport."""
+        assert NFLDataProvider()._parse_game(espn_event()).sport == "nfl"
+    
+    def test_parse_status(self):
+        """Test ESPN state mapping and the status-name fallback."""
+        provider = NHLDataProvider()
+        
+        assert provider._parse_status({"type": {"state": "in"}}) == GameStatus.IN_PROGRESS
+        assert provider._parse_status({"type": {"state": "post"}}) == GameStatus.FINAL
+        assert provider._parse_status({"type": {"name": "STATUS_POSTPONED"}}) == GameStatus.POSTPONED
+        assert provider._parse_status({}) == GameStatus.SCHEDULED
+    
+    def test_nfl_counts_halftime_as_live(self):
+        """Test that NFL keeps halftime games in the live feed."""
+        event = espn_event(state="halftime")
+        event["status"]["type"]["name"] = "STATUS_HALFTIME"
+        
+        assert NFLDataProvider()._event_is_live(event) is True
+        assert NHLDataProvider()._event_is_live(event) is False
+    
+    def test_unchanged_event_reuses_parsed_game(self):
+        """Test that only events whose score or clock moved are re-parsed."""
+        provider = NHLDataProvider()
+        first = provider._cached_parse(espn_event())
+        
+        same = provider._cached_parse(espn_event())
+        scored = provider._cached_parse(espn_event(home_score="3"))
+        
+        assert same is first
+        assert scored is not first
+        assert scored.home_score == 3
+
+
+class TestNFLDataProvider:
+    """Tests for NFL scoring detection."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = NFLDataProvider()
+    
+    async def test_detect_touchdown(self):
+        """Test that a 7-point change is reported as a converted touchdown."""
+        previous = {1: make_game(home_score=3, away_score=0)}
+        current = [make_game(home_score=3, away_score=7)]
+        
+        events = await self.provider.detect_scoring_events(previous, current)
+        
+        assert len(events) == 1
+        assert events[0].scoring_type == "touchdown_pat"
+        assert events[0].points_scored == 7
+    
+    async def test_events_in_one_poll_share_timestamp(self):
+        """Test that both sides scoring in one poll emit two events with one timestamp."""
+        previous = {1: make_game(home_score=0, away_score=0)}
+        current = [make_game(home_score=3, away_score=7)]
+        
+        events = await self.provider.detect_scoring_events(previous, current)
+        
+        assert [e.is_home_team for e in events] == [True, False]
+        assert events[0].id == "nfl-1-home-3-1"
+        assert events[0].timestamp is events[1].timestamp
+    
+    def test_determine_scoring_type(self):
+        """Test the points-to-scoring-type lookup and its fallback."""
+        assert self.provider._determine_scoring_type(3) == "field_goal"
+        assert self.provider._determine_scoring_type(8) == "touchdown_2pt"
+        assert self.provider._determine_scoring_type(5) == "score"
+        assert self.provider._determine_scoring_type(14) == "score"
+    
+    async def test_unchanged_scoreboard_emits_nothing(self):
+        """Test that an unchanged scoreboard produces no events."""
+        previous = {1: make_game(home_score=3)}
+        current = [make_game(home_score=3)]
+        
+        assert await self.provider.detect_scoring_events(previous, current) == []
+    
+    async def test_failed_detection_is_retried_on_replay(self, monkeypatch):
+        """Test that a slate whose detection raised is detected when replayed."""
+        previous = {1: make_game(home_score=0)}
+        current = [make_game(home_score=7)]
+        make_event = self.provider._make_event
+        calls = []
+        
+        def flaky_make_event(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return make_event(*args)
+        
+        monkeypatch.setattr(self.provider, "_make_event", flaky_make_event)
+        
+        with pytest.raises(RuntimeError):
+            await self.provider.detect_scoring_events(previous, current)
+        events = await self.provider.detect_scoring_events(previous, current)
+        
+        assert [e.id for e in events] == ["nfl-1-home-7-1"]
+
+
+class TestNBADataProvider:
+    """Tests for NBA scoring-run detection."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = NBADataProvider()
+    
+    async def test_detect_home_run(self):
+        """Test that a 10-2 home run produces one event."""
+        previous = {1: make_game(home_score=40, away_score=40), 2: make_game(2)}
+        current = [make_game(home_score=50, away_score=42), make_game(2, home_score=3)]
+        
+        events = await self.provider.detect_scoring_events(previous, current)
+        
+        assert len(events) == 1
+        assert events[0].is_home_team is True
+        assert events[0].points_scored == 10
+    
+    async def test_ignores_even_scoring(self):
+        """Test that both teams scoring is not a run."""
+        previous = {1: make_game(home_score=40, away_score=40)}
+        current = [make_game(home_score=52, away_score=50)]
+        
+        assert await self.provider.detect_scoring_events(previous, current) == []
+
+
+class TestSoccerDataProvider:
+    """Tests for Football-Data.org fetching."""
+    
+    @pytest.fixture(autouse=True)
+    def canned_transport(self, mock_http):
+        """Set up a provider with a canned transport."""
+        self.requests = []
+        self.status_code = 200
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(self.status_code, json={"matches": []})
+        
+        self.provider = SoccerDataProvider()
+        self.provider.api_key = "test-key"
+        mock_http(handler)
+    
+    async def test_live_games_single_filtered_request(self):
+        """Test that all tracked competitions are fetched in one request."""
+        games = await self.provider.get_live_games()
+        
+        assert games == []
+        assert len(self.requests) == 1
+        params = self.requests[0].url.params
+        assert params["competitions"] == "PL,PD,BL1,SA,FL1,CL,EC,WC"
+        assert params["status"] == "IN_PLAY,PAUSED"
+        assert self.requests[0].headers["X-Auth-Token"] == "test-key"
+    
+    async def test_rate_limited(self):
+        """Test that a 429 yields no games."""
+        self.status_code = 429
+        
+        assert await self.provider.get_games_today() == []
+    
+    async def test_detect_goal_once(self):
+        """Test that a goal is reported once when the same slate is replayed."""
+        previous = {1: make_game(home_score=0, away_score=0)}
+        current = [make_game(home_score=0, away_score=1)]
+        
+        events = await self.provider.detect_scoring_events(previous, current)
+        repeat = await self.provider.detect_scoring_events(previous, current)
+        
+        assert [e.id for e in events] == ["soccer-1-away-1"]
+        assert repeat == []
+
+
+class TestMLBDecisionEngine:
+    """Tests for the MLB late-inning strategy."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = MLBDecisionEngine()
+        self.mapping = BaseGameMarketMapping(
+            game_id=1,
+            sport="mlb",
+            home_team_name="Boston Bruins",
+            away_team_name="Buffalo Sabres",
+            start_time=datetime(2024, 1, 15, 19, 0, 0),
+            spread=-1.5
+        )
+    
+    def _event(self, inning: int, home_score: int, away_score: int) -> BaseScoringEvent:
+        return BaseScoringEvent(
+            id=f"mlb-1-away-{away_score}-{inning}",
+            game_id=1,
+            sport="mlb",
+            timestamp=datetime(2024, 1, 15, 21, 0, 0),
+            period=inning,
+            clock="",
+            scoring_team_id=20,
+            scoring_team_name="Buffalo Sabres",
+            is_home_team=False,
+            points_scored=1,
+            scoring_type="runs",
+            home_score=home_score,
+            away_score=away_score
+        )
+    
+    def test_is_underdog_from_spread(self):
+        """Test the spread is read from each team's perspective."""
+        game = make_game()
+        
+        assert self.engine.is_underdog(20, game, self.mapping) == (True, 1.5, "Spread: +1.5")
+        assert self.engine.is_underdog(10, game, self.mapping) == (False, -1.5, "Spread: -1.5")
+    
+    def test_rejects_early_innings_first(self):
+        """Test that early-inning runs are rejected before other checks."""
+        event = self._event(inning=2, home_score=9, away_score=1)
+        
+        ok, reason = self.engine.should_trade(event, make_game(period=2), self.mapping)
+        
+        assert ok is False
+        assert "Early innings" in reason
+    
+    def test_event_derives_differential_and_leader(self):
+        """Test the score-derived fields on scoring events."""
+        event = self._event(inning=7, home_score=2, away_score=5)
+        
+        assert event.differential == 3
+        assert event.leader == -1
+        assert score_leader(4, 4) == 0
+    
+    def test_check_lead_change(self):
+        """Test lead change detection against the previous leader."""
+        event = self._event(inning=7, home_score=3, away_score=4)
+        
+        assert self.engine._check_lead_change(event, score_leader(3, 3)) is True
+        assert self.engine._check_lead_change(event, score_leader(3, 4)) is False
+    
+    def test_underdog_late_run_trades(self):
+        """Test that an underdog run in a late, close game trades."""
+        event = self._event(inning=7, home_score=3, away_score=3)
+        
+        ok, reason = self.engine.should_trade(event, make_game(period=7), self.mapping)
+        
+        assert ok is True
+        assert "Underdog" in reason
+
+
+class StaticProvider(NHLDataProvider):
+    """NHL provider that serves a canned list of live games."""
+    
+    def __init__(self):
+        super().__init__()
+        self.games = []
+    
+    async def get_live_games(self):
+        return list(self.games)
+
+
+class TestSportsManager:
+    """Tests for the multi-sport polling manager."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = StaticProvider()
+        self.manager = SportsManager()
+        self.manager.register_sport("nhl", self.provider, NHLDecisionEngine())
+        self.sport = self.manager.get_sport("nhl")
+    
+    async def test_poll_replaces_snapshot(self):
+        """Test that each poll replaces the previous games and the cached snapshot."""
+        self.provider.games = [make_game(1), make_game(2)]
+        await self.manager._poll_sport(self.sport)
+        
+        self.provider.games = [make_game(1), make_game(2, away_score=1)]
+        events = await self.manager._poll_sport(self.sport)
+        
+        assert len(events) == 1
+        assert self.manager._previous_games["nhl"][2].away_score == 1
+        assert len(self.manager.get_cached_games("nhl")) == 2
+    
+    async def test_poll_prunes_finished_games(self):
+        """Test that games dropping out of the live feed are pruned."""
+        self.provider.games = [make_game(1), make_game(2)]
+        await self.manager._poll_sport(self.sport)
+        
+        self.provider.games = [make_game(2)]
+        await self.manager._poll_sport(self.sport)
+        
+        assert list(self.manager._previous_games["nhl"]) == [2]
+        assert [g.id for g in self.manager.get_cached_games("nhl")] == [2]
+    
+    async def test_get_all_live_games(self):
+        """Test fetching live games across registered sports."""
+        other = StaticProvider()
+        other.games = [make_game(5)]
+        self.manager.register_sport("nhl2", other, NHLDecisionEngine())
+        self.provider.games = [make_game(1)]
+        
+        result = await self.manager.get_all_live_games()
+        
+        assert [g.id for g in result["nhl"]] == [1]
+        assert [g.id for g in result["nhl2"]] == [5]
+    
+    async def test_get_all_live_games_isolates_failures(self, monkeypatch):
+        """Test that one failing provider blanks only its own sport."""
+        other = StaticProvider()
+        self.manager.register_sport("nhl2", other, NHLDecisionEngine())
+        self.provider.games = [make_game(1)]
+        
+        async def fail():
+            raise RuntimeError("provider down")
+        
+        monkeypatch.setattr(other, "get_live_games", fail)
+        
+        result = await self.manager.get_all_live_games()
+        
+        assert [g.id for g in result["nhl"]] == [1]
+        assert result["nhl2"] == []
+    
+    async def test_subscribers_receive_events(self):
+        """Test that scoring events are pushed to subscriber queues."""
+        queue = self.manager.subscribe(maxsize=1)
+        previous = {1: make_game(home_score=0)}
+        events = await self.provider.detect_scoring_events(previous, [make_game(home_score=1)])
+        
+        await self.manager._notify_callbacks(events[0], make_game(home_score=1), "nhl")
+        await self.manager._notify_callbacks(events[0], make_game(home_score=1), "nhl")
+        
+        event, game, sport_name = queue.get_nowait()
+        assert event is events[0]
+        assert sport_name == "nhl"
+        assert queue.empty()
+        
+        self.manager.unsubscribe(queue)
+        assert self.manager._subscribers == []